@@ -0,0 +1,49 @@
+"""Add full-text search vector to jobs
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('search_vec', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION jobs_search_vec_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vec :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(array_to_string(NEW.requirements, ' '), '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+    CREATE TRIGGER jobs_search_vec_trigger
+    BEFORE INSERT OR UPDATE OF title, description, requirements ON jobs
+    FOR EACH ROW EXECUTE FUNCTION jobs_search_vec_update()
+    """)
+
+    # Backfill existing rows through the trigger
+    op.execute("UPDATE jobs SET title = title")
+
+    op.create_index('jobs_search_gin', 'jobs', ['search_vec'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('jobs_search_gin', table_name='jobs')
+    op.execute("DROP TRIGGER IF EXISTS jobs_search_vec_trigger ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS jobs_search_vec_update()")
+    op.drop_column('jobs', 'search_vec')
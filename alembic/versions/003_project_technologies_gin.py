@@ -0,0 +1,23 @@
+"""Add GIN index on project technologies
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-02-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves `technologies @> ARRAY[...]` containment filters
+    op.create_index('projects_technologies_gin', 'projects', ['technologies'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('projects_technologies_gin', table_name='projects')
@@ -4,12 +4,13 @@ Job management endpoints with RemoteOK integration.
 
 from fastapi import APIRouter, Query, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 from pydantic import BaseModel
 from loguru import logger
 import uuid
 
-from app.database.base import get_db
+from app.database.base import get_db, get_async_db
 from app.services.job_service import JobService
 from app.schemas.job import JobResponse
 
@@ -62,13 +63,14 @@ async def get_jobs(
 @router.post("/fetch")
 async def fetch_jobs(
     request: JobFetchRequest = JobFetchRequest(),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db)
 ):
     """Trigger job fetching from external APIs."""
     logger.info(f"Fetch jobs endpoint called with keywords: {request.keywords}")
     
     try:
-        job_service = JobService(db)
+        job_service = JobService(db, async_db)
         
         # Fetch and store jobs
         results = await job_service.fetch_and_store_jobs(
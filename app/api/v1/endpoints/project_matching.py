@@ -28,11 +28,11 @@ from app.services.project_service import ProjectService
 router = APIRouter()
 
 # Initialize services
-matcher = TFIDFProjectMatcher()
 cache_service = MatchingCacheService(
     redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
     default_ttl=3600  # 1 hour cache
 )
+matcher = TFIDFProjectMatcher(cache_service=cache_service)
 
 
 class ProjectMatchRequest(BaseModel):
@@ -1,16 +1,24 @@
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel
 from loguru import logger
 
 from app.database.base import get_db
 from app.schemas.resume import (
+    EducationItem,
+    SkillCategory,
+    ExperienceItem,
     ResumeGenerationRequest, 
-    BulkResumeRequest,
-    ResumeResponse, 
-    BulkResumeResponse
+    ResumeResponse
 )
+from app.services.job_service import JobService
+from app.services.project_service import ProjectService
 from app.services.resume_generator import resume_generator, ResumeGenerationError
 from app.services.resume_helpers import (
     get_job_context, 
@@ -20,6 +28,16 @@ from app.services.resume_helpers import (
 )
 
 router = APIRouter()
+
+# ============================================================================
+# BULK RESUME MODELS
+# ============================================================================
+
+class BulkResumeRequest(BaseModel):
+    """Request model for bulk resume generation."""
+    job_ids: List[str]
+    
+    # Personal Information
     name: str
     phone: str
     location: str
@@ -53,7 +71,7 @@ class BulkResumeResponse(BaseModel):
     resumes_generated: List[Dict[str, Any]]
     failed_jobs: List[Dict[str, Any]]
     processing_summary: Dict[str, Any]
-    download_urls: List[Dict[str, str]]
+    download_urls: List[Dict[str, Any]]
 
 class JobFilesResponse(BaseModel):
     """Response model for job-specific files."""
@@ -99,7 +117,7 @@ async def generate_resume(
         # Get selected projects
         selected_projects = None
         if request.selected_project_ids and request.projects:
-            selected_projects = _filter_projects_by_ids(
+            selected_projects = filter_projects_by_ids(
                 request.projects, request.selected_project_ids
             )
             logger.info(f"Selected {len(selected_projects)} specific projects")
@@ -229,7 +247,8 @@ async def generate_bulk_resumes(
             "processing_summary": {}
         }
         
-        # Process each job
+        # Prepare each job: look it up and pick its best projects
+        prepared_jobs = []
         for job_id in request.job_ids:
             try:
                 logger.info(f"Processing job {job_id}...")
@@ -254,33 +273,7 @@ async def generate_bulk_resumes(
                     "location": job.location
                 }
                 
-                # Generate resume with job-specific context
-                resume_result = resume_generator.generate_resume(
-                    user_data=user_data,
-                    selected_projects=best_projects,
-                    job_context=job_context,
-                    job_id=job_id
-                )
-                
-                # Add to successful results
-                job_result = {
-                    "job_id": job_id,
-                    "job_title": job.title,
-                    "job_company": job.company,
-                    "resume_id": resume_result["resume_id"],
-                    "resume_file_path": resume_result["file_path"],
-                    "generation_method": resume_result["generation_method"],
-                    "selected_projects": [{"title": p["title"], "technologies": p.get("technologies", [])} for p in best_projects],
-                    "projects_count": len(best_projects),
-                    "matching_summary": {
-                        "total_projects_analyzed": len(all_user_projects),
-                        "best_projects_selected": len(best_projects),
-                        "job_match_score": f"{_calculate_job_match_score(best_projects, job):.1f}%"
-                    }
-                }
-                
-                results["resumes_generated"].append(job_result)
-                logger.info(f"✅ Resume generated for {job.title} at {job.company}")
+                prepared_jobs.append((job_id, job, best_projects, (user_data, best_projects, job_context, job_id)))
                 
             except Exception as e:
                 logger.error(f"❌ Failed to generate resume for job {job_id}: {e}")
@@ -289,6 +282,42 @@ async def generate_bulk_resumes(
                     "error": str(e)
                 })
         
+        # Compile all resumes in parallel without blocking the event loop
+        resume_results = await asyncio.get_running_loop().run_in_executor(
+            None,
+            resume_generator.generate_resumes_bulk,
+            [generation_request for *_, generation_request in prepared_jobs]
+        )
+        
+        for (job_id, job, best_projects, _), resume_result in zip(prepared_jobs, resume_results):
+            if isinstance(resume_result, Exception):
+                logger.error(f"❌ Failed to generate resume for job {job_id}: {resume_result}")
+                results["failed_jobs"].append({
+                    "job_id": job_id,
+                    "error": str(resume_result)
+                })
+                continue
+            
+            # Add to successful results
+            job_result = {
+                "job_id": job_id,
+                "job_title": job.title,
+                "job_company": job.company,
+                "resume_id": resume_result["resume_id"],
+                "resume_file_path": resume_result["file_path"],
+                "generation_method": resume_result["generation_method"],
+                "selected_projects": [{"title": p["title"], "technologies": p.get("technologies", [])} for p in best_projects],
+                "projects_count": len(best_projects),
+                "matching_summary": {
+                    "total_projects_analyzed": len(all_user_projects),
+                    "best_projects_selected": len(best_projects),
+                    "job_match_score": f"{_calculate_job_match_score(best_projects, job):.1f}%"
+                }
+            }
+            
+            results["resumes_generated"].append(job_result)
+            logger.info(f"✅ Resume generated for {job.title} at {job.company}")
+        
         # Generate download URLs
         download_urls = []
         for resume in results["resumes_generated"]:
@@ -783,23 +812,6 @@ async def _get_job_context(job_id: str, db: Session) -> Optional[Dict[str, Any]]
         logger.warning(f"Could not get job context for {job_id}: {e}")
         return None
 
-def _filter_projects_by_ids(
-    all_projects: List[ProjectItem],
-    selected_ids: List[str]
-) -> List[Dict[str, Any]]:
-    """Filter projects by selected IDs."""
-    # For now, assume project IDs are indices
-    selected_projects = []
-    for project_id in selected_ids:
-        try:
-            index = int(project_id)
-            if 0 <= index < len(all_projects):
-                selected_projects.append(all_projects[index].dict())
-        except (ValueError, IndexError):
-            logger.warning(f"Invalid project ID: {project_id}")
-    
-    return selected_projects
-
 def _match_projects_to_job(user_projects: List[Any], job: Any, max_projects: int = 4) -> List[Dict[str, Any]]:
     """
     Simple project-to-job matching algorithm.
@@ -1,6 +1,7 @@
 #config information
 import os
 from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -36,6 +37,30 @@ class Settings:
             raise ValueError("DATABASE_URL is required. Please set up your Supabase credentials in .env file.")
         return self.DATABASE_URL
     
+    @property
+    def getAsyncDatabaseUrl(self) -> str:
+        #same database, but through the asyncpg driver for AsyncSession
+        url=self.getDatabaseUrl
+        for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                url="postgresql+asyncpg://" + url[len(prefix):]
+                break
+        #asyncpg.connect has no sslmode argument; it takes the same values as ssl=
+        parts=urlsplit(url)
+        if parts.query:
+            query=[("ssl" if key == "sslmode" else key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+            url=urlunsplit(parts._replace(query=urlencode(query)))
+        return url
+    
+    @property
+    def getAsyncpgDsn(self) -> str:
+        #plain libpq-style DSN for asyncpg.create_pool (no SQLAlchemy driver suffix)
+        url=self.getDatabaseUrl
+        for prefix in ("postgresql+psycopg2://", "postgresql+asyncpg://"):
+            if url.startswith(prefix):
+                return "postgresql://" + url[len(prefix):]
+        return url
+    
     # Redis settings (for future caching and task queue)
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     
@@ -2,19 +2,40 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from loguru import logger
 
 from app.core.config import settings
 
+# Supabase's pooler caps client connections on small tiers and drops idle ones,
+# so keep pools small and recycle connections before the server closes them
+_POOL_OPTIONS=dict(
+    pool_size=3,
+    max_overflow=2,
+    pool_pre_ping=True,  # Verify connections before use
+    pool_recycle=1800,
+    pool_timeout=30,
+)
+
 # Create database engine
 engine=create_engine(
     settings.getDatabaseUrl,
-    pool_pre_ping=True,  # Verify connections before use
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    **_POOL_OPTIONS,
+)
+
+# Create async database engine (asyncpg) for non-blocking write paths.
+# Prepared statements are disabled: the transaction pooler does not keep them per client.
+async_engine=create_async_engine(
+    settings.getAsyncDatabaseUrl,
+    echo=settings.DEBUG,
+    connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    **_POOL_OPTIONS,
 )
 
-# Create session factory
+# Create session factories
 SessionLocal=sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal=async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Create base class for models
 Base=declarative_base()
@@ -36,6 +57,20 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency to get an async database session.
+    Use this in FastAPI endpoints with Depends(get_async_db).
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {e}")
+            await db.rollback()
+            raise
+
+
 def init_db():
     """Initialize database tables."""
     logger.info("Initializing database tables...")
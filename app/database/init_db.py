@@ -18,9 +18,10 @@ def init_db():
         # Import all models to ensure they are registered
         from app.models import User, Project, Job, Application
         
-        # Create all tables
+        # Create all tables in one transaction instead of a commit per CREATE
         from app.database.base import Base
-        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn, checkfirst=True)
         
         logger.info("Database tables created successfully")
         
@@ -69,6 +70,21 @@ def check_db_connection():
         return False
 
 
+def warm_connection_pool():
+    """Open pool_size connections up front so the first requests skip the handshake."""
+    connections = []
+    try:
+        for _ in range(engine.pool.size()):
+            connections.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"Could not pre-warm connection pool: {e}")
+        return
+    finally:
+        for connection in connections:
+            connection.close()
+    logger.info(f"Connection pool warmed: {engine.pool.status()}")
+
+
 if __name__ == "__main__":
     # Run database initialization
     createDatabaseIfNotExists()
@@ -5,7 +5,9 @@ Main FastAPI application entry point with logging and middleware configuration.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
+import os
 import sys
 
 from app.core.config import settings
@@ -24,10 +26,11 @@ async def lifespan(app: FastAPI):
     
     # Initialize database
     try:
-        from app.database.init_db import check_db_connection, init_db
+        from app.database.init_db import check_db_connection, init_db, warm_connection_pool
         
         if check_db_connection():
             init_db()
+            warm_connection_pool()
             logger.info("✅ Database initialized successfully")
         else:
             logger.warning("⚠️  Database connection failed - some features may not work")
@@ -38,6 +41,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("📴 Job Application System shutting down...")
+    
+    from app.services.job_source_config import job_source_manager
+    await job_source_manager.aclose()
+    
+    from app.services.resume_generator import resume_generator
+    resume_generator.shutdown()
 
 
 def create_application() -> FastAPI:
@@ -50,6 +59,8 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url="/docs",
         redoc_url="/redoc",
+        # orjson serializes datetimes natively; APPLYBOT_JSON=json falls back to the stdlib encoder
+        default_response_class=JSONResponse if os.environ.get("APPLYBOT_JSON", "orjson") == "json" else ORJSONResponse,
         lifespan=lifespan
     )
 
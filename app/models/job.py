@@ -1,7 +1,7 @@
 #this will define that how the fetched jobs will be getting stored in the DB
-from sqlalchemy import Column, String, DateTime, Text, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, ARRAY, DDL, Index, event
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 
@@ -33,8 +33,40 @@ class Job(Base):
     posted_date=Column(DateTime(timezone=True), nullable=True)
     fetched_at=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
+    # Full-text search vector, maintained by the jobs_search_vec_update trigger. Deferred so
+    # loading jobs doesn't fetch it; only the full-text filter reads it, inside the database
+    search_vec=deferred(Column(TSVECTOR, nullable=True))
+    
     # Relationships
     applications=relationship("Application", back_populates="job", cascade="all, delete-orphan")
     
+    __table_args__=(
+        Index("jobs_search_gin", "search_vec", postgresql_using="gin"),
+    )
+    
     def __repr__(self):
-        return f"<Job(id={self.id}, title={self.title}, company={self.company})>"
\ No newline at end of file
+        return f"<Job(id={self.id}, title={self.title}, company={self.company})>"
+
+
+# Keep search_vec in sync on insert/update (weights: title A, description B, requirements C).
+# Mirrors alembic revision 002 so create_all() databases get the same trigger.
+JOBS_SEARCH_VEC_FUNCTION=DDL("""
+CREATE OR REPLACE FUNCTION jobs_search_vec_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vec :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(array_to_string(NEW.requirements, ' '), '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+
+JOBS_SEARCH_VEC_TRIGGER=DDL("""
+CREATE TRIGGER jobs_search_vec_trigger
+BEFORE INSERT OR UPDATE OF title, description, requirements ON jobs
+FOR EACH ROW EXECUTE FUNCTION jobs_search_vec_update()
+""")
+
+event.listen(Job.__table__, "after_create", JOBS_SEARCH_VEC_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(Job.__table__, "after_create", JOBS_SEARCH_VEC_TRIGGER.execute_if(dialect="postgresql"))
\ No newline at end of file
@@ -2,7 +2,7 @@
 Project model - simplified to match existing database schema.
 """
 
-from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -39,6 +39,10 @@ class Project(Base):
     # Relationships
     user = relationship("User", back_populates="projects")
     
+    __table_args__=(
+        Index("projects_technologies_gin", "technologies", postgresql_using="gin"),
+    )
+    
     def __repr__(self):
         return f"<Project(id={self.id}, title={self.title}, user_id={self.user_id})>"
     
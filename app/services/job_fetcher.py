@@ -3,7 +3,8 @@ Generic job fetcher interface and implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime
 import httpx
 from loguru import logger
@@ -16,10 +17,33 @@ load_dotenv()
 
 
 class JobFetcher(ABC):
+    # Shared HTTP client injected by JobSourceManager; None means open a client per fetch
+    client: Optional[httpx.AsyncClient] = None
+    
+    @asynccontextmanager
+    async def _http_client(self):
+        """Yield the shared HTTP client, or a short-lived one when none was injected."""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                yield client
+    
     @abstractmethod
     async def fetch_jobs(self, keywords: List[str], limit: int = 50) -> List[JobCreate]:
         pass
     
+    async def iter_jobs(self, keywords: List[str], limit: int = 50) -> AsyncIterator[JobCreate]:
+        """
+        Yield jobs one at a time.
+        
+        Default implementation wraps fetch_jobs for single-request sources; paginated
+        sources (Reed, Adzuna) override this to yield each page as it arrives so
+        callers can store in batches.
+        """
+        for job in await self.fetch_jobs(keywords, limit):
+            yield job
+    
     @abstractmethod
     def get_source_name(self) -> str:
         pass
@@ -28,7 +52,8 @@ class JobFetcher(ABC):
 class RemoteOKFetcher(JobFetcher):
     """Job fetcher for RemoteOK API."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
         self.base_url = "https://remoteok.com/api" #RemoteOk API
         self.source_name = "RemoteOK"
     
@@ -43,10 +68,11 @@ class RemoteOKFetcher(JobFetcher):
         """
         try:
             logger.info(f"Fetching jobs from RemoteOK with keywords: {keywords}")
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with self._http_client() as client:
                 # RemoteOK API endpoint
                 response = await client.get(
                     self.base_url,
+                    follow_redirects=True,
                     headers={
                         "User-Agent": "JobApplicationSystem/1.0 (Educational Project)",
                         "Accept": "application/json"
@@ -213,7 +239,10 @@ class RemoteOKFetcher(JobFetcher):
 class ReedFetcher(JobFetcher):
     """Job fetcher for Reed.co.uk API."""
     
-    def __init__(self):
+    PAGE_SIZE = 100  # Reed max results per request
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
         self.base_url = "https://www.reed.co.uk/api/1.0"
         self.source_name = "Reed"
         # Get API key from environment or config
@@ -229,65 +258,75 @@ class ReedFetcher(JobFetcher):
         Reed API Documentation: https://www.reed.co.uk/developers
         Free tier: 1000 requests per month
         """
+        return [job async for job in self.iter_jobs(keywords, limit)]
+    
+    async def iter_jobs(self, keywords: List[str], limit: int = 50) -> AsyncIterator[JobCreate]:
+        """
+        Yield Reed jobs page by page (resultsToSkip paging) until limit or the results run out.
+        
+        Errors are logged and end the iteration; jobs from earlier pages have already been yielded.
+        """
         try:
             logger.info(f"Fetching jobs from Reed with keywords: {keywords}")
             
             if self.api_key == "YOUR_REED_API_KEY_HERE":
                 logger.warning("Reed API key not configured - skipping Reed jobs")
-                return []
-            
-            # Construct search parameters
-            search_params = {
-                "keywords": " ".join(keywords) if keywords else "",
-                "locationName": "Remote",
-                "distanceFromLocation": 15,
-                "permanent": "true",
-                "resultsToTake": min(limit, 100),  # Reed max is 100
-                "resultsToSkip": 0
-            }
-            
-            # Remove empty parameters
-            search_params = {k: v for k, v in search_params.items() if v}
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/search",
-                    params=search_params,
-                    auth=(self.api_key, ""),  # Reed uses basic auth with API key as username
-                    headers={
-                        "User-Agent": "JobApplicationSystem/1.0"
+                return
+            
+            async with self._http_client() as client:
+                fetched = 0
+                while fetched < limit:
+                    take = min(limit - fetched, self.PAGE_SIZE)
+                    
+                    # Construct search parameters
+                    search_params = {
+                        "keywords": " ".join(keywords) if keywords else "",
+                        "locationName": "Remote",
+                        "distanceFromLocation": 15,
+                        "permanent": "true",
+                        "resultsToTake": take,
+                        "resultsToSkip": fetched
                     }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                jobs_data = data.get("results", [])
-                
-                logger.info(f"Retrieved {len(jobs_data)} jobs from Reed")
-                
-                # Parse jobs
-                parsed_jobs = []
-                for job_data in jobs_data:
-                    try:
-                        job = self._parse_reed_job(job_data)
+                    
+                    # Remove empty parameters
+                    search_params = {k: v for k, v in search_params.items() if v}
+                    
+                    response = await client.get(
+                        f"{self.base_url}/search",
+                        params=search_params,
+                        auth=(self.api_key, ""),  # Reed uses basic auth with API key as username
+                        headers={
+                            "User-Agent": "JobApplicationSystem/1.0"
+                        }
+                    )
+                    response.raise_for_status()
+                    
+                    jobs_data = response.json().get("results", [])
+                    fetched += len(jobs_data)
+                    
+                    logger.info(f"Retrieved {len(jobs_data)} jobs from Reed")
+                    
+                    # Parse jobs
+                    for job_data in jobs_data:
+                        try:
+                            job = self._parse_reed_job(job_data)
+                        except Exception as e:
+                            logger.warning(f"Failed to parse Reed job: {e}")
+                            continue
                         if job:
-                            parsed_jobs.append(job)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse Reed job: {e}")
-                        continue
-                
-                logger.info(f"Parsed {len(parsed_jobs)} Reed jobs")
-                return parsed_jobs
+                            yield job
+                    
+                    # A short page means there are no more results
+                    if len(jobs_data) < take:
+                        break
                 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 logger.error("Reed API authentication failed - check API key")
             else:
                 logger.error(f"Reed API error: {e.response.status_code}")
-            return []
         except Exception as e:
             logger.error(f"Reed fetching failed: {e}")
-            return []
     
     def _parse_reed_job(self, job_data: Dict[str, Any]) -> Optional[JobCreate]:
         """Parse Reed job data into JobCreate object."""
@@ -365,7 +404,10 @@ class ReedFetcher(JobFetcher):
 class AdzunaFetcher(JobFetcher):
     """Job fetcher for Adzuna API."""
     
-    def __init__(self):
+    PAGE_SIZE = 50  # Adzuna max results per page
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
         self.base_url = "https://api.adzuna.com/v1/api/jobs"
         self.source_name = "Adzuna"
         # Get API credentials from environment
@@ -383,22 +425,30 @@ class AdzunaFetcher(JobFetcher):
         Adzuna API Documentation: https://developer.adzuna.com/
         Free tier: 1000 calls per month
         """
+        return [job async for job in self.iter_jobs(keywords, limit)]
+    
+    async def iter_jobs(self, keywords: List[str], limit: int = 50) -> AsyncIterator[JobCreate]:
+        """
+        Yield Adzuna jobs page by page until limit or the results run out.
+        
+        Errors are logged and end the iteration; jobs from earlier pages have already been yielded.
+        """
         try:
             logger.info(f"Fetching jobs from Adzuna with keywords: {keywords}")
             
             if (self.app_id == "YOUR_ADZUNA_APP_ID_HERE" or 
                 self.app_key == "YOUR_ADZUNA_APP_KEY_HERE"):
                 logger.warning("Adzuna API credentials not configured - skipping Adzuna jobs")
-                return []
+                return
             
-            # Adzuna search endpoint
-            search_url = f"{self.base_url}/{self.country}/search/1"
+            # Pages are numbered from 1 and must all use the same page size
+            per_page = min(limit, self.PAGE_SIZE)
             
             # Search parameters
             params = {
                 "app_id": self.app_id,
                 "app_key": self.app_key,
-                "results_per_page": min(limit, 50),  # Adzuna max is 50
+                "results_per_page": per_page,
                 "what": " ".join(keywords) if keywords else "",
                 "content-type": "application/json"
             }
@@ -406,34 +456,40 @@ class AdzunaFetcher(JobFetcher):
             # Remove empty parameters
             params = {k: v for k, v in params.items() if v}
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    search_url,
-                    params=params,
-                    headers={
-                        "User-Agent": "JobApplicationSystem/1.0"
-                    }
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                jobs_data = data.get("results", [])
-                
-                logger.info(f"Retrieved {len(jobs_data)} jobs from Adzuna")
-                
-                # Parse jobs
-                parsed_jobs = []
-                for job_data in jobs_data:
-                    try:
-                        job = self._parse_adzuna_job(job_data)
+            async with self._http_client() as client:
+                fetched = 0
+                page = 1
+                while fetched < limit:
+                    # Adzuna search endpoint
+                    response = await client.get(
+                        f"{self.base_url}/{self.country}/search/{page}",
+                        params=params,
+                        headers={
+                            "User-Agent": "JobApplicationSystem/1.0"
+                        }
+                    )
+                    response.raise_for_status()
+                    
+                    jobs_data = response.json().get("results", [])
+                    
+                    logger.info(f"Retrieved {len(jobs_data)} jobs from Adzuna")
+                    
+                    # Parse jobs, stopping at the limit part-way through the last page
+                    for job_data in jobs_data[:limit - fetched]:
+                        try:
+                            job = self._parse_adzuna_job(job_data)
+                        except Exception as e:
+                            logger.warning(f"Failed to parse Adzuna job: {e}")
+                            continue
                         if job:
-                            parsed_jobs.append(job)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse Adzuna job: {e}")
-                        continue
-                
-                logger.info(f"Parsed {len(parsed_jobs)} Adzuna jobs")
-                return parsed_jobs
+                            yield job
+                    
+                    fetched += len(jobs_data)
+                    page += 1
+                    
+                    # A short page means there are no more results
+                    if len(jobs_data) < per_page:
+                        break
                 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -442,10 +498,8 @@ class AdzunaFetcher(JobFetcher):
                 logger.error("Adzuna API rate limit exceeded")
             else:
                 logger.error(f"Adzuna API error: {e.response.status_code}")
-            return []
         except Exception as e:
             logger.error(f"Adzuna fetching failed: {e}")
-            return []
     
     def _parse_adzuna_job(self, job_data: Dict[str, Any]) -> Optional[JobCreate]:
         """Parse Adzuna job data into JobCreate object."""
@@ -534,7 +588,8 @@ class AdzunaFetcher(JobFetcher):
 class GitHubJobsFetcher(JobFetcher):
     """Job fetcher for GitHub Jobs (using GitHub's search API for repositories with job postings)."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
         self.base_url = "https://api.github.com"
         self.source_name = "GitHub"
     
@@ -564,7 +619,7 @@ class GitHubJobsFetcher(JobFetcher):
                 for keyword in keywords[:3]:  # Limit to avoid rate limiting
                     search_queries.append(f"hiring {keyword} remote")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._http_client() as client:
                 for query in search_queries[:2]:  # Limit queries to avoid rate limiting
                     try:
                         response = await client.get(
@@ -3,10 +3,16 @@ Main job service that orchestrates job fetching and storage.
 """
 
 from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta
+import uuid
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.models.job import Job
 from app.services.job_fetcher import JobFetcher
+from app.schemas.job import JobCreate
 from app.services.job_storage import JobStorageService
 from app.services.job_source_config import job_source_manager
 from app.database.base import get_db
@@ -15,15 +21,19 @@ from app.database.base import get_db
 class JobService:
     """Main service for job operations."""
     
-    def __init__(self, db: Session):
+    # Jobs are stored in batches of this size while a source is still streaming
+    STORE_BATCH_SIZE = 200
+    
+    def __init__(self, db: Session, async_db: Optional[AsyncSession] = None):
         self.db = db
-        self.storage_service = JobStorageService(db)
+        self.storage_service = JobStorageService(db, async_db)
         self.fetchers: List[JobFetcher] = job_source_manager.get_enabled_fetchers()
     
     async def fetch_and_store_jobs(
         self, 
         keywords: Optional[List[str]] = None,
-        limit_per_source: int = 50
+        limit_per_source: int = 50,
+        initial_sync: bool = False
     ) -> Dict[str, Any]:
         """
         Fetch jobs from all configured sources and store them.
@@ -31,6 +41,7 @@ class JobService:
         Args:
             keywords: Keywords to search for
             limit_per_source: Maximum jobs to fetch per source
+            initial_sync: Bulk-load large batches without deduplication
             
         Returns:
             Dictionary with fetching results and statistics
@@ -46,33 +57,34 @@ class JobService:
             "errors": []
         }
         
+        # Initial syncs use COPY-sized batches so the bulk-load path can kick in
+        batch_size = JobStorageService.COPY_THRESHOLD if initial_sync else self.STORE_BATCH_SIZE
+        
         # Fetch from all sources
         for fetcher in self.fetchers:
             source_name = fetcher.get_source_name()
             logger.info(f"Fetching jobs from {source_name}")
             
+            source_stats = {"fetched": 0, "new": 0, "updated": 0}
+            
             try:
-                # Fetch jobs from this source
-                jobs = await fetcher.fetch_jobs(keywords or [], limit_per_source)
+                # Stream jobs from this source and store them in bounded batches
+                batch: List[JobCreate] = []
+                async for job in fetcher.iter_jobs(keywords or [], limit_per_source):
+                    batch.append(job)
+                    if len(batch) >= batch_size:
+                        await self._store_batch(batch, source_stats, results, initial_sync)
+                        batch.clear()
                 
-                if jobs:
-                    # Store jobs in database
-                    total_processed, new_jobs, updated_jobs = await self.storage_service.store_jobs(jobs)
-                    
-                    # Update results
-                    results["total_fetched"] += len(jobs)
-                    results["total_stored"] += total_processed
-                    results["new_jobs"] += new_jobs
-                    results["updated_jobs"] += updated_jobs
-                    
-                    results["sources"][source_name] = {
-                        "fetched": len(jobs),
-                        "new": new_jobs,
-                        "updated": updated_jobs,
-                        "status": "success"
-                    }
-                    
-                    logger.info(f"{source_name}: {len(jobs)} fetched, {new_jobs} new, {updated_jobs} updated")
+                if batch:
+                    await self._store_batch(batch, source_stats, results, initial_sync)
+                
+                if source_stats["fetched"]:
+                    results["sources"][source_name] = {**source_stats, "status": "success"}
+                    logger.info(
+                        f"{source_name}: {source_stats['fetched']} fetched, "
+                        f"{source_stats['new']} new, {source_stats['updated']} updated"
+                    )
                 else:
                     results["sources"][source_name] = {
                         "fetched": 0,
@@ -86,11 +98,11 @@ class JobService:
                 error_msg = f"{source_name} fetch failed: {str(e)}"
                 logger.error(error_msg)
                 
+                # Counts only include batches that were committed before the failure
+                # (a StoreError batch never reaches _store_batch's accounting)
                 results["errors"].append(error_msg)
                 results["sources"][source_name] = {
-                    "fetched": 0,
-                    "new": 0,
-                    "updated": 0,
+                    **source_stats,
                     "status": "error",
                     "error": str(e)
                 }
@@ -98,6 +110,32 @@ class JobService:
         logger.info(f"Job fetch complete: {results['new_jobs']} new, {results['updated_jobs']} updated")
         return results
     
+    async def _store_batch(
+        self,
+        batch: List[JobCreate],
+        source_stats: Dict[str, int],
+        results: Dict[str, Any],
+        initial_sync: bool
+    ):
+        """
+        Store one batch of fetched jobs and fold its counts into the totals.
+        
+        Counts are only added once store_jobs returns, so a batch that raises
+        StoreError contributes nothing.
+        """
+        total_processed, new_jobs, updated_jobs = await self.storage_service.store_jobs(
+            batch, initial_sync=initial_sync
+        )
+        
+        source_stats["fetched"] += len(batch)
+        source_stats["new"] += new_jobs
+        source_stats["updated"] += updated_jobs
+        
+        results["total_fetched"] += len(batch)
+        results["total_stored"] += total_processed
+        results["new_jobs"] += new_jobs
+        results["updated_jobs"] += updated_jobs
+    
     def search_jobs(
         self,
         keywords: Optional[List[str]] = None,
@@ -116,15 +154,17 @@ class JobService:
         )
     
     def get_job_by_id(self, job_id: str):
-        """Get a specific job by ID."""
-        from app.models.job import Job
-        return self.db.query(Job).filter(Job.id == job_id).first()
+        """Get a specific job by ID (served from the session identity map when already loaded)."""
+        # Identity map keys are UUID objects, so normalise string IDs first
+        try:
+            job_uuid = job_id if isinstance(job_id, uuid.UUID) else uuid.UUID(str(job_id))
+        except ValueError:
+            return None
+        
+        return self.db.get(Job, job_uuid)
     
     def get_job_statistics(self) -> Dict[str, Any]:
         """Get job database statistics."""
-        from app.models.job import Job
-        from sqlalchemy import func
-        
         total_jobs = self.db.query(Job).count()
         
         # Jobs by source
@@ -134,7 +174,6 @@ class JobService:
         ).group_by(Job.source).all()
         
         # Recent jobs (last 7 days)
-        from datetime import datetime, timedelta
         week_ago = datetime.utcnow() - timedelta(days=7)
         recent_jobs = self.db.query(Job).filter(Job.fetched_at >= week_ago).count()
         
@@ -142,7 +181,7 @@ class JobService:
             "total_jobs": total_jobs,
             "recent_jobs_7_days": recent_jobs,
             "jobs_by_source": {source: count for source, count in jobs_by_source},
-            "last_updated": datetime.utcnow().isoformat()
+            "last_updated": datetime.utcnow()
         }
     
     def add_job_fetcher(self, fetcher: JobFetcher):
@@ -2,7 +2,9 @@
 Job source configuration and management.
 """
 
-from typing import List, Dict, Any
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Optional, Tuple, Type
+import httpx
 from loguru import logger
 
 from app.services.job_fetcher import (
@@ -14,73 +16,118 @@ from app.services.job_fetcher import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class SourceCfg:
+    """Immutable configuration for a single job source."""
+    name: str
+    cls: Type[JobFetcher]
+    enabled: bool
+    description: str
+    api_type: str
+    rate_limit: str
+
+
 class JobSourceManager:
     """Manages available job sources and their configuration."""
     
     def __init__(self):
-        self.available_sources = {
-            "remoteok": {
-                "name": "RemoteOK",
-                "class": RemoteOKFetcher,
-                "enabled": True,
-                "description": "Remote job listings from RemoteOK.com",
-                "api_type": "REST API",
-                "rate_limit": "No authentication required"
-            },
-            "github": {
-                "name": "GitHub",
-                "class": GitHubJobsFetcher,
-                "enabled": True,
-                "description": "Tech jobs from GitHub repositories and organizations",
-                "api_type": "GitHub API",
-                "rate_limit": "60 requests/hour (unauthenticated)"
-            },
-            "reed": {
-                "name": "Reed",
-                "class": ReedFetcher,
-                "enabled": True,  # Enabled - will skip if no API key
-                "description": "UK job listings from Reed.co.uk",
-                "api_type": "REST API",
-                "rate_limit": "1000 requests/month (free tier)"
-            },
-            "adzuna": {
-                "name": "Adzuna",
-                "class": AdzunaFetcher,
-                "enabled": True,  # Enabled - will skip if no API credentials
-                "description": "Global job listings from Adzuna",
-                "api_type": "REST API",
-                "rate_limit": "1000 calls/month (free tier)"
-            }
+        self._sources: Dict[str, SourceCfg] = {
+            "remoteok": SourceCfg(
+                name="RemoteOK",
+                cls=RemoteOKFetcher,
+                enabled=True,
+                description="Remote job listings from RemoteOK.com",
+                api_type="REST API",
+                rate_limit="No authentication required"
+            ),
+            "github": SourceCfg(
+                name="GitHub",
+                cls=GitHubJobsFetcher,
+                enabled=True,
+                description="Tech jobs from GitHub repositories and organizations",
+                api_type="GitHub API",
+                rate_limit="60 requests/hour (unauthenticated)"
+            ),
+            "reed": SourceCfg(
+                name="Reed",
+                cls=ReedFetcher,
+                enabled=True,  # Enabled - will skip if no API key
+                description="UK job listings from Reed.co.uk",
+                api_type="REST API",
+                rate_limit="1000 requests/month (free tier)"
+            ),
+            "adzuna": SourceCfg(
+                name="Adzuna",
+                cls=AdzunaFetcher,
+                enabled=True,  # Enabled - will skip if no API credentials
+                description="Global job listings from Adzuna",
+                api_type="REST API",
+                rate_limit="1000 calls/month (free tier)"
+            )
         }
+        self._enabled_tuple: Tuple[SourceCfg, ...] = ()
+        self._refresh_enabled()
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client shared by all fetchers (created lazily).
+        
+        One connection pool means keep-alive connections and TLS sessions
+        are reused across fetch requests instead of re-handshaking each time.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=128,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=75
+                )
+            )
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
+    def _refresh_enabled(self):
+        """Recompute the cached tuple of enabled sources (only on enable/disable)."""
+        self._enabled_tuple = tuple(cfg for cfg in self._sources.values() if cfg.enabled)
+    
+    def _set_enabled(self, source_id: str, enabled: bool) -> bool:
+        """Swap in an updated config for a source and refresh the enabled cache."""
+        if source_id not in self._sources:
+            return False
+        self._sources[source_id] = replace(self._sources[source_id], enabled=enabled)
+        self._refresh_enabled()
+        return True
     
     def get_enabled_fetchers(self) -> List[JobFetcher]:
         """Get list of enabled job fetchers."""
         fetchers = []
         
-        for source_id, config in self.available_sources.items():
-            if config["enabled"]:
-                try:
-                    fetcher_class = config["class"]
-                    fetcher = fetcher_class()
-                    fetchers.append(fetcher)
-                    logger.info(f"Enabled job source: {config['name']}")
-                except Exception as e:
-                    logger.error(f"Failed to initialize {config['name']}: {e}")
+        for cfg in self._enabled_tuple:
+            try:
+                fetchers.append(cfg.cls(client=self.get_client()))
+                logger.info(f"Enabled job source: {cfg.name}")
+            except Exception as e:
+                logger.error(f"Failed to initialize {cfg.name}: {e}")
         
         return fetchers
     
     def enable_source(self, source_id: str) -> bool:
         """Enable a job source."""
-        if source_id in self.available_sources:
-            self.available_sources[source_id]["enabled"] = True
+        if self._set_enabled(source_id, True):
             logger.info(f"Enabled job source: {source_id}")
             return True
         return False
     
     def disable_source(self, source_id: str) -> bool:
         """Disable a job source."""
-        if source_id in self.available_sources:
-            self.available_sources[source_id]["enabled"] = False
+        if self._set_enabled(source_id, False):
             logger.info(f"Disabled job source: {source_id}")
             return True
         return False
@@ -89,22 +136,18 @@ class JobSourceManager:
         """Get information about all available sources."""
         return {
             source_id: {
-                "name": config["name"],
-                "enabled": config["enabled"],
-                "description": config["description"],
-                "api_type": config["api_type"],
-                "rate_limit": config["rate_limit"]
+                "name": cfg.name,
+                "enabled": cfg.enabled,
+                "description": cfg.description,
+                "api_type": cfg.api_type,
+                "rate_limit": cfg.rate_limit
             }
-            for source_id, config in self.available_sources.items()
+            for source_id, cfg in self._sources.items()
         }
     
     def get_enabled_source_names(self) -> List[str]:
         """Get names of enabled sources."""
-        return [
-            config["name"] 
-            for config in self.available_sources.values() 
-            if config["enabled"]
-        ]
+        return [cfg.name for cfg in self._enabled_tuple]
 
 
 # Global instance
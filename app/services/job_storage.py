@@ -2,49 +2,91 @@
 Job storage service with deduplication logic.
 """
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+import uuid
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select
 from loguru import logger
+from rapidfuzz import fuzz
 
 from app.models.job import Job
 from app.schemas.job import JobCreate
 from app.database.base import get_db
 
 
+class StoreError(Exception):
+    """Raised when a batch of jobs could not be committed; nothing from the batch was stored."""
+    
+    def __init__(self, message: str, new_jobs_lost: int = 0, updated_lost: int = 0):
+        super().__init__(message)
+        self.new_jobs_lost = new_jobs_lost
+        self.updated_lost = updated_lost
+
+
 class JobStorageService:
     """Service for storing and managing job data with deduplication."""
     
-    def __init__(self, db: Session):
+    # Batches at least this large use COPY instead of per-row inserts on initial sync
+    COPY_THRESHOLD = 500
+    COPY_COLUMNS = [
+        "id", "title", "company", "description", "location", "salary_range",
+        "requirements", "application_email", "source", "external_id",
+        "posted_date", "fetched_at"
+    ]
+    
+    def __init__(self, db: Session, async_db: Optional[AsyncSession] = None):
         self.db = db
+        self.async_db = async_db  # Used by store_jobs so writes don't block the event loop
     
-    async def store_jobs(self, jobs: List[JobCreate]) -> Tuple[int, int, int]:
+    async def store_jobs(self, jobs: List[JobCreate], initial_sync: bool = False) -> Tuple[int, int, int]:
         """
         Store jobs in database with deduplication.
         
         Args:
             jobs: List of JobCreate objects to store
+            initial_sync: Set for ingests into an empty/fresh table where no
+                duplicates are expected; large batches then skip dedup and
+                are bulk-loaded with COPY
             
         Returns:
             Tuple of (total_processed, new_jobs, updated_jobs)
+            
+        Raises:
+            StoreError: If the batch could not be committed (no counts are reported)
         """
         if not jobs:
             return 0, 0, 0
         
+        if self.async_db is None:
+            raise RuntimeError("store_jobs requires an AsyncSession (pass async_db)")
+        
         total_processed = len(jobs)
         new_jobs = 0
         updated_jobs = 0
         
+        # Single timestamp for the whole batch keeps fetched_at consistent
+        now = datetime.utcnow()
+        
+        if initial_sync and total_processed >= self.COPY_THRESHOLD:
+            new_jobs = await self._copy_jobs(jobs, now)
+            return total_processed, new_jobs, 0
+        
         logger.info(f"Processing {total_processed} jobs for storage")
         
-        for job_data in jobs:
+        # Lower-cased title/company signatures for fuzzy dedup, computed once per job
+        signatures = [(job, job.title.lower(), job.company.lower()) for job in jobs]
+        
+        for job_data, title_lower, company_lower in signatures:
             try:
-                existing_job = self._find_duplicate(job_data)
+                existing_job = await self._find_duplicate(job_data, title_lower, company_lower)
                 
                 if existing_job:
-                    # Update existing job if needed
-                    if self._should_update_job(existing_job, job_data):
-                        self._update_job(existing_job, job_data)
+                    # Update existing job only with fields that actually changed
+                    if (changes := self._diff_job(existing_job, job_data, now)):
+                        for field, value in changes.items():
+                            setattr(existing_job, field, value)
                         updated_jobs += 1
                         logger.debug(f"Updated job: {job_data.title} at {job_data.company}")
                 else:
@@ -59,16 +101,22 @@ class JobStorageService:
         
         # Commit all changes
         try:
-            self.db.commit()
+            await self.async_db.commit()
             logger.info(f"Job storage complete: {new_jobs} new, {updated_jobs} updated, {total_processed} total")
         except Exception as e:
-            self.db.rollback()
+            await self.async_db.rollback()
+            # Drop in-memory mutations so dirty instances can't leak into later use of the session
+            self.async_db.expire_all()
             logger.error(f"Failed to commit job storage: {e}")
-            raise
+            raise StoreError(
+                f"Failed to commit job storage: {e}",
+                new_jobs_lost=new_jobs,
+                updated_lost=updated_jobs
+            ) from e
         
         return total_processed, new_jobs, updated_jobs
     
-    def _find_duplicate(self, job_data: JobCreate) -> Optional[Job]:
+    async def _find_duplicate(self, job_data: JobCreate, title_lower: str, company_lower: str) -> Optional[Job]:
         """
         Find duplicate job based on multiple criteria.
         
@@ -79,123 +127,128 @@ class JobStorageService:
         """
         # Strategy 1: Exact match by external_id and source
         if job_data.external_id:
-            exact_match = self.db.query(Job).filter(
-                and_(
-                    Job.external_id == job_data.external_id,
-                    Job.source == job_data.source
-                )
-            ).first()
+            exact_match = (await self.async_db.execute(
+                select(Job).where(
+                    and_(
+                        Job.external_id == job_data.external_id,
+                        Job.source == job_data.source
+                    )
+                ).limit(1)
+            )).scalars().first()
             
             if exact_match:
                 return exact_match
         
         # Strategy 2: Match by title and company (case-insensitive)
-        title_company_match = self.db.query(Job).filter(
-            and_(
-                Job.title.ilike(f"%{job_data.title}%"),
-                Job.company.ilike(f"%{job_data.company}%")
-            )
-        ).first()
+        title_company_match = (await self.async_db.execute(
+            select(Job).where(
+                and_(
+                    Job.title.ilike(f"%{job_data.title}%"),
+                    Job.company.ilike(f"%{job_data.company}%")
+                )
+            ).limit(1)
+        )).scalars().first()
         
         if title_company_match:
             # Additional check: if it's very similar, consider it a duplicate
-            if self._is_similar_job(title_company_match, job_data):
+            if self._is_similar_job(title_company_match, title_lower, company_lower):
                 return title_company_match
         
         return None
     
-    def _is_similar_job(self, existing_job: Job, new_job_data: JobCreate) -> bool:
+    def _is_similar_job(self, existing_job: Job, new_title_lower: str, new_company_lower: str) -> bool:
         """
         Check if two jobs are similar enough to be considered duplicates.
         
-        Uses fuzzy matching on title and company.
+        Uses rapidfuzz token-set fuzzy matching on title and company. The new
+        job's lower-cased title/company are precomputed once in store_jobs.
         """
-        # Simple similarity check (can be enhanced with fuzzy string matching)
-        title_similarity = self._calculate_similarity(
-            existing_job.title.lower(), 
-            new_job_data.title.lower()
+        title_similarity = fuzz.token_set_ratio(
+            existing_job.title.lower(),
+            new_title_lower
         )
         
-        company_similarity = self._calculate_similarity(
+        company_similarity = fuzz.token_set_ratio(
             existing_job.company.lower(),
-            new_job_data.company.lower()
+            new_company_lower
         )
         
         # Consider similar if both title and company have high similarity
-        return title_similarity > 0.8 and company_similarity > 0.9
-    
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """
-        Calculate simple string similarity ratio.
-        
-        This is a basic implementation. For production, consider using
-        libraries like fuzzywuzzy or difflib for better fuzzy matching.
-        """
-        if not str1 or not str2:
-            return 0.0
-        
-        # Simple Jaccard similarity on words
-        words1 = set(str1.split())
-        words2 = set(str2.split())
-        
-        if not words1 and not words2:
-            return 1.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
+        return title_similarity > 80 and company_similarity > 90
     
-    def _should_update_job(self, existing_job: Job, new_job_data: JobCreate) -> bool:
+    def _diff_job(self, existing_job: Job, new_job_data: JobCreate, now: datetime) -> Dict[str, Any]:
         """
-        Determine if an existing job should be updated with new data.
+        Compute the fields of an existing job that should be updated with new data.
         
         Update if:
-        1. New job has more complete information
-        2. Description has changed significantly
-        3. Requirements have been updated
+        1. New job has a longer (more complete) description
+        2. Salary information is added
+        3. Application email is added
+        4. Requirements list has grown
+        
+        Returns:
+            Dict of field -> new value; empty when no update is needed
         """
-        # Update if new job has description and existing doesn't
-        if new_job_data.description and not existing_job.description:
-            return True
+        changes: Dict[str, Any] = {}
         
-        # Update if new job has more requirements
-        if len(new_job_data.requirements) > len(existing_job.requirements or []):
-            return True
+        if new_job_data.description and len(new_job_data.description) > len(existing_job.description or ""):
+            changes["description"] = new_job_data.description
         
-        # Update if salary information is added
         if new_job_data.salary_range and not existing_job.salary_range:
-            return True
+            changes["salary_range"] = new_job_data.salary_range
         
-        # Update if application email is added
         if new_job_data.application_email and not existing_job.application_email:
-            return True
+            changes["application_email"] = new_job_data.application_email
+        
+        if len(new_job_data.requirements) > len(existing_job.requirements or []):
+            changes["requirements"] = new_job_data.requirements
         
-        return False
+        # Refresh the fetched_at timestamp whenever something changed
+        if changes:
+            changes["fetched_at"] = now
+        
+        return changes
     
-    def _update_job(self, existing_job: Job, new_job_data: JobCreate):
-        """Update existing job with new data."""
-        # Update fields that might have new information
-        if new_job_data.description and len(new_job_data.description) > len(existing_job.description or ""):
-            existing_job.description = new_job_data.description
+    async def _copy_jobs(self, jobs: List[JobCreate], now: datetime) -> int:
+        """
+        Bulk-load jobs with PostgreSQL COPY via asyncpg.
         
-        if new_job_data.salary_range and not existing_job.salary_range:
-            existing_job.salary_range = new_job_data.salary_range
+        Skips deduplication; only used for initial syncs where no conflicts
+        are expected. The search_vec trigger still fires for COPY rows.
+        """
+        records = [
+            (
+                uuid.uuid4(), job.title, job.company, job.description, job.location,
+                job.salary_range, job.requirements, job.application_email,
+                job.source, job.external_id, job.posted_date, now
+            )
+            for job in jobs
+        ]
         
-        if new_job_data.application_email and not existing_job.application_email:
-            existing_job.application_email = new_job_data.application_email
+        logger.info(f"Bulk loading {len(records)} jobs with COPY")
         
-        if len(new_job_data.requirements) > len(existing_job.requirements or []):
-            existing_job.requirements = new_job_data.requirements
+        try:
+            connection = await self.async_db.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                Job.__tablename__,
+                records=records,
+                columns=self.COPY_COLUMNS
+            )
+            await self.async_db.commit()
+        except Exception as e:
+            await self.async_db.rollback()
+            self.async_db.expire_all()
+            logger.error(f"Failed to bulk load jobs: {e}")
+            raise StoreError(f"Failed to bulk load jobs: {e}", new_jobs_lost=len(records)) from e
         
-        # Always update the fetched_at timestamp
-        from datetime import datetime
-        existing_job.fetched_at = datetime.utcnow()
+        logger.info(f"Job storage complete (COPY): {len(records)} new")
+        return len(records)
     
     def _create_job(self, job_data: JobCreate):
         """Create a new job record."""
         job = Job(**job_data.dict())
-        self.db.add(job)
+        self.async_db.add(job)
     
     def get_jobs_count(self) -> int:
         """Get total number of jobs in database."""
@@ -217,7 +270,7 @@ class JobStorageService:
         Search jobs with filters.
         
         Args:
-            keywords: Keywords to search in title and description
+            keywords: Keywords to full-text search in title, description and requirements
             location: Location filter
             company: Company filter
             limit: Maximum results to return
@@ -230,17 +283,14 @@ class JobStorageService:
         
         # Apply filters
         if keywords:
-            keyword_filters = []
-            for keyword in keywords:
-                keyword_filter = or_(
-                    Job.title.ilike(f"%{keyword}%"),
-                    Job.description.ilike(f"%{keyword}%"),
-                    Job.requirements.any(keyword)
-                )
-                keyword_filters.append(keyword_filter)
+            # Jobs must match at least one keyword; tsquery `||` is OR, and
+            # each plainto_tsquery ANDs the terms of a multi-word keyword.
+            # Served by the jobs_search_gin index on search_vec.
+            ts_query = func.plainto_tsquery("english", keywords[0])
+            for keyword in keywords[1:]:
+                ts_query = ts_query.op("||")(func.plainto_tsquery("english", keyword))
             
-            # Jobs must match at least one keyword
-            query = query.filter(or_(*keyword_filters))
+            query = query.filter(Job.search_vec.op("@@")(ts_query))
         
         if location:
             query = query.filter(Job.location.ilike(f"%{location}%"))
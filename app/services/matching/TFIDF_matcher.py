@@ -2,25 +2,174 @@
 TF-IDF based project matching implementation.
 """
 
-import re
 import math
+import hashlib
+import functools
+import threading
 from collections import Counter, defaultdict
-from typing import List, Dict, Any, Set
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from dataclasses import dataclass
+from typing import List, Dict, Any, Set, Optional, Tuple
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+from scipy.sparse import csr_matrix, csc_matrix
 import numpy as np
+from joblib import Parallel, delayed
 from loguru import logger
 
 from .base_matcher import BaseProjectMatcher, MatchResult, JobContext
+from .cache_service import MatchingCacheService
+from ._numba_kernels import combine_scores
 from app.models import Project
 
+# Set-bit count for every byte value, used to popcount packed bitmasks
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# Custom stop words for technical content
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 
+    'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'how', 
+    'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 
+    'its', 'let', 'put', 'say', 'she', 'too', 'use', 'will', 'about',
+    'after', 'again', 'against', 'all', 'also', 'any', 'because', 'been',
+    'before', 'being', 'between', 'both', 'each', 'few', 'from', 'have',
+    'here', 'into', 'more', 'most', 'only', 'other', 'some', 'such',
+    'than', 'that', 'the', 'their', 'them', 'these', 'they', 'this',
+    'through', 'very', 'were', 'what', 'when', 'where', 'which', 'while',
+    'with', 'would', 'your'
+})
+
+# Built once so every vectorizer shares the same list object
+_STOP_WORDS_LIST = sorted(_STOP_WORDS)
+
+# Technology keyword mappings for better matching
+_TECH_KEYWORDS = {
+    'web_development': [
+        'react', 'angular', 'vue', 'javascript', 'typescript', 'html', 'css',
+        'node', 'express', 'django', 'flask', 'fastapi', 'spring'
+    ],
+    'mobile_development': [
+        'android', 'ios', 'flutter', 'react-native', 'swift', 'kotlin', 'xamarin'
+    ],
+    'machine_learning': [
+        'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'opencv',
+        'keras', 'xgboost', 'ml', 'ai', 'deep-learning', 'neural-network'
+    ],
+    'data_science': [
+        'python', 'r', 'sql', 'tableau', 'powerbi', 'jupyter', 'matplotlib',
+        'seaborn', 'plotly', 'statistics', 'analytics'
+    ],
+    'cloud_devops': [
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform',
+        'ansible', 'ci-cd', 'devops'
+    ]
+}
+
+def _sparse_to_arrays(name: str, matrix) -> Dict[str, np.ndarray]:
+    """Flatten a CSR/CSC matrix into plain arrays for the model cache (nothing for None)."""
+    if matrix is None:
+        return {}
+    return {
+        f"{name}_data": matrix.data,
+        f"{name}_indices": matrix.indices,
+        f"{name}_indptr": matrix.indptr,
+        f"{name}_shape": np.array(matrix.shape),
+    }
+
+
+def _sparse_from_arrays(name: str, arrays: Dict[str, np.ndarray], matrix_type):
+    """Rebuild a matrix flattened by _sparse_to_arrays, or None if it was not stored."""
+    if f"{name}_data" not in arrays:
+        return None
+    return matrix_type(
+        (arrays[f"{name}_data"], arrays[f"{name}_indices"], arrays[f"{name}_indptr"]),
+        shape=tuple(arrays[f"{name}_shape"])
+    )
+
+
+class _PunctTable(dict):
+    r"""
+    str.translate table mapping every non-word, non-space character to a space.
+    
+    Same character set as the regex ``[^\w\s]``, so Unicode punctuation from pasted
+    text (smart quotes, dashes, bullets) is stripped too. Entries are filled in on
+    first sight of each code point; after that lookups stay in C.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char == '_' or char.isspace() else 32
+        return self[codepoint]
+
+
+_PUNCT_TABLE = _PunctTable()
+
+
+def _clean_text(text: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace."""
+    return " ".join(text.lower().translate(_PUNCT_TABLE).split())
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_keywords(text: str, stop_words: frozenset) -> frozenset:
+    """Extract meaningful keywords from text (memoized; pure function of its inputs)."""
+    # Filter out short words, stop words and numbers
+    return frozenset(
+        word for word in text.lower().translate(_PUNCT_TABLE).split()
+        if len(word) >= 3 and not word.isdigit() and word not in stop_words
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _project_to_doc(
+    project_id: str,
+    updated_at: str,
+    title: str,
+    description: str,
+    category: str,
+    technologies: tuple,
+    skills: tuple
+) -> str:
+    """Cleaned TF-IDF document for one project, cached per project revision."""
+    text_parts = [title, description, category, " ".join(technologies), " ".join(skills)]
+    return _clean_text(" ".join(text_parts))
+
+
+@dataclass(frozen=True, slots=True)
+class _FittedState:
+    """Matching state for one project set; replaced as a whole, never mutated."""
+    fingerprint: str
+    idf: np.ndarray  # Dense IDF weights over the hashed features
+    project_matrix: Any  # IDF-weighted, L2-normalised project rows (CSR)
+    keyword_terms: List[str]
+    keyword_vocab: Dict[str, int]
+    keyword_matrix: Any  # Binary (projects x terms) incidence, CSC for column slicing
+    tech_terms: List[str]
+    tech_vocab: Dict[str, int]
+    tech_bits: np.ndarray  # Packed (projects x techs) bitmasks, uint8
+
+
 class TFIDFProjectMatcher(BaseProjectMatcher):
     """TF-IDF based project matching with keyword analysis."""
     
-    def __init__(self):
-        self.vectorizer = None
-        self.stop_words = self._get_custom_stop_words()
-        self.tech_keywords = self._load_technology_keywords()
+    def __init__(self, cache_service: Optional[MatchingCacheService] = None):
+        self.stop_words = _STOP_WORDS  # Shared frozenset, hashable for the keyword cache
+        # Stateless feature hashing: no vocabulary to fit or keep in memory
+        self.hasher = HashingVectorizer(
+            n_features=1 << 18,
+            alternate_sign=False,
+            ngram_range=(1, 2),  # Include bigrams
+            stop_words=_STOP_WORDS_LIST,
+            norm=None,  # Raw counts; TF-IDF weighting and normalisation happen afterwards
+            dtype=np.float32  # Halves the bytes the similarity matvec has to stream
+        )
+        self.tech_keywords = _TECH_KEYWORDS
+        self.cache_service = cache_service
+        
+        # Fitted state for the last project set seen. Matches read it through the value
+        # _ensure_fitted returns, so a concurrent refit for another user swaps in a new
+        # object instead of changing one that is being scored
+        self._state: Optional[_FittedState] = None
+        self._fit_lock = threading.Lock()  # Fitted state is built exactly once under concurrent matches
         
     def match_projects(
         self, 
@@ -35,56 +184,46 @@ class TFIDFProjectMatcher(BaseProjectMatcher):
         
         logger.info(f"Matching {len(projects)} projects to job: {job_context.title}")
         
-        # Prepare documents for TF-IDF
-        project_documents = self._prepare_project_documents(projects)
-        job_document = self._prepare_job_document(job_context)
+        # Fit TF-IDF over the project corpus only when it has changed
+        state = self._ensure_fitted(projects)
         
-        # Calculate TF-IDF similarities
-        similarity_scores = self._calculate_tfidf_similarity(
-            project_documents, job_document
-        )
+        # Component scores as aligned per-project arrays; match details are kept in a
+        # vectorised form and only expanded for the selected projects below
+        job_document = self._prepare_job_document(job_context)
+        tfidf_scores = self._calculate_tfidf_similarity(state, job_document)
+        keyword_scores, keyword_hits = self._calculate_keyword_matches(state, job_context, len(projects))
+        tech_scores, tech_masks = self._calculate_technology_matches(state, job_context, len(projects))
         
-        # Calculate keyword matches
-        keyword_matches = self._calculate_keyword_matches(projects, job_context)
+        # Weighted combination: TF-IDF similarity, keyword matching, technology matching
+        confidence_scores = combine_scores(tfidf_scores, keyword_scores, tech_scores, 0.4, 0.35, 0.25)
         
-        # Calculate technology matches
-        tech_matches = self._calculate_technology_matches(projects, job_context)
+        # Select the top results with a partial sort, then build results only for them
+        top_indices = self._top_k_indices(confidence_scores, max_results)
+        components = np.column_stack((tfidf_scores, keyword_scores, tech_scores, confidence_scores))[top_indices]
+        rounded = np.round(components, 3).tolist()
         
-        # Combine scores and create results
         results = []
-        for i, project in enumerate(projects):
-            
-            # Weighted scoring
-            tfidf_score = similarity_scores[i]
-            keyword_score = keyword_matches[i]['score']
-            tech_score = tech_matches[i]['score']
-            
-            # Combine scores with weights
-            confidence_score = (
-                tfidf_score * 0.4 +          # TF-IDF similarity
-                keyword_score * 0.35 +       # Keyword matching
-                tech_score * 0.25            # Technology matching
-            )
+        for i, scores, rounded_scores in zip(top_indices.tolist(), components.tolist(), rounded):
+            tfidf_score, keyword_score, tech_score, confidence_score = scores
+            matched_keywords = self._matched_keywords(state, keyword_hits, i)
+            tech_details = self._technology_details(state, tech_masks, i)
             
             # Create explanation
             explanation = {
                 "algorithm": "TF-IDF + Keyword Matching",
-                "tfidf_similarity": round(tfidf_score, 3),
-                "keyword_match_score": round(keyword_score, 3),
-                "technology_match_score": round(tech_score, 3),
-                "weighted_final_score": round(confidence_score, 3),
+                "tfidf_similarity": rounded_scores[0],
+                "keyword_match_score": rounded_scores[1],
+                "technology_match_score": rounded_scores[2],
+                "weighted_final_score": rounded_scores[3],
                 "matching_details": {
-                    "matched_keywords": keyword_matches[i]['keywords'],
-                    "matched_technologies": tech_matches[i]['technologies'],
-                    "missing_required_skills": tech_matches[i]['missing_required'],
+                    "matched_keywords": matched_keywords,
+                    "matched_technologies": tech_details['technologies'],
+                    "missing_required_skills": tech_details['missing_required'],
                 }
             }
             
             # Extract all matching keywords for easy access
-            all_matching_keywords = (
-                keyword_matches[i]['keywords'] + 
-                tech_matches[i]['technologies']
-            )
+            all_matching_keywords = matched_keywords + tech_details['technologies']
             
             similarity_breakdown = {
                 "content_similarity": tfidf_score,
@@ -93,7 +232,7 @@ class TFIDFProjectMatcher(BaseProjectMatcher):
             }
             
             result = MatchResult(
-                project=project,
+                project=projects[i],
                 confidence_score=confidence_score,
                 explanation=explanation,
                 matching_keywords=all_matching_keywords,
@@ -102,32 +241,77 @@ class TFIDFProjectMatcher(BaseProjectMatcher):
             
             results.append(result)
         
-        # Sort by confidence score and return top results
-        results.sort(key=lambda x: x.confidence_score, reverse=True)
-        return results[:max_results]
+        return results
     
-    def _prepare_project_documents(self, projects: List[Project]) -> List[str]:
-        """Prepare project text documents for TF-IDF analysis."""
-        documents = []
-        
-        for project in projects:
-            # Combine all project text fields
-            text_parts = [
-                project.title or "",
-                project.description or "",
-                project.category or "",
-                " ".join(project.technologies or []),
-                " ".join(project.skills_demonstrated or []),
-            ]
-            
-            document = " ".join(text_parts).lower()
-            # Clean and normalize text
-            document = re.sub(r'[^\w\s]', ' ', document)
-            document = re.sub(r'\s+', ' ', document).strip()
+    def match_projects_bulk(
+        self,
+        projects: List[Project],
+        job_contexts: List[JobContext],
+        max_results: int = 5,
+        n_jobs: int = -1
+    ) -> List[List[MatchResult]]:
+        """
+        Match one project set against many jobs in parallel.
+        
+        The model is fitted once up front; the per-job transform and sparse matvec run on
+        threads, sharing the fitted state without pickling.
+        
+        Args:
+            projects: List of user projects to match against
+            job_contexts: Jobs to match, one result list per job
+            max_results: Maximum number of results per job
+            n_jobs: Number of worker threads (-1 for all cores)
             
-            documents.append(document)
+        Returns:
+            Lists of MatchResult objects, in the same order as job_contexts
+        """
+        if not projects:
+            return [[] for _ in job_contexts]
         
-        return documents
+        self._ensure_fitted(projects)
+        
+        return Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(self.match_projects)(projects, job_context, max_results)
+            for job_context in job_contexts
+        )
+    
+    def _top_k_indices(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, best first (ties keep project order)."""
+        
+        k = min(max(k, 0), len(scores))
+        if k == 0:
+            return np.array([], dtype=int)
+        
+        if k < len(scores):
+            # O(N) selection, then only the k winners get sorted
+            candidates = np.sort(np.argpartition(-scores, k - 1)[:k])
+        else:
+            candidates = np.arange(len(scores))
+        
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+    
+    def _featurize_project(self, project: Project) -> Tuple[str, frozenset, frozenset]:
+        """
+        Read a project once and derive all of its matching features.
+        
+        Returns (document, keywords, technologies): the cleaned TF-IDF document, its keyword
+        set and the lower-cased technologies/skills used for the tech bitmask.
+        """
+        technologies = tuple(project.technologies or ())
+        skills = tuple(project.skills_demonstrated or ())
+        
+        document = _project_to_doc(
+            str(project.id),
+            str(project.updated_at),
+            project.title or "",
+            project.description or "",
+            project.category or "",
+            technologies,
+            skills,
+        )
+        techs = frozenset(tech.lower() for tech in technologies + skills)
+        
+        return document, _extract_keywords(document, self.stop_words), techs
     
     def _prepare_job_document(self, job_context: JobContext) -> str:
         """Prepare job description document for TF-IDF analysis."""
@@ -139,177 +323,266 @@ class TFIDFProjectMatcher(BaseProjectMatcher):
             " ".join(job_context.preferred_skills or [])
         ]
         
-        document = " ".join(text_parts).lower()
-        # Clean and normalize text
-        document = re.sub(r'[^\w\s]', ' ', document)
-        document = re.sub(r'\s+', ' ', document).strip()
+        # Clean and normalize text: strip punctuation, collapse whitespace
+        return _clean_text(" ".join(text_parts))
+    
+    def _projects_fingerprint(self, projects: List[Project]) -> str:
+        """Cheap, process-stable fingerprint of a project set (ids + last update)."""
+        signature = repr([(str(p.id), str(p.updated_at)) for p in projects])
+        return hashlib.sha1(signature.encode()).hexdigest()[:16]
+    
+    def _ensure_fitted(self, projects: List[Project]) -> _FittedState:
+        """Return the fitted state for this project set, fitting (or loading) it if needed."""
+        
+        fingerprint = self._projects_fingerprint(projects)
+        state = self._state
+        if state is not None and state.fingerprint == fingerprint:
+            return state
         
-        return document
+        with self._fit_lock:
+            # Another thread may have fitted this project set while we waited
+            state = self._state
+            if state is None or state.fingerprint != fingerprint:
+                state = self._fit_projects(projects, fingerprint)
+                self._state = state
+            return state
     
-    def _calculate_tfidf_similarity(
-        self, 
-        project_documents: List[str], 
-        job_document: str
-    ) -> List[float]:
-        """Calculate TF-IDF cosine similarity between projects and job."""
-        
-        # Combine all documents for vectorization
-        all_documents = project_documents + [job_document]
-        
-        # Create TF-IDF vectorizer
-        self.vectorizer = TfidfVectorizer(
-            stop_words=list(self.stop_words),
-            max_features=5000,
-            ngram_range=(1, 2),  # Include bigrams
-            min_df=1,
-            max_df=0.8
+    def _fit_projects(self, projects: List[Project], fingerprint: str) -> _FittedState:
+        """Load or fit the matching state for a project set."""
+        
+        model_key = f"tfidf:v3:{projects[0].user_id}:{fingerprint}"
+        state = self.cache_service.get_cached_model(model_key) if self.cache_service else None
+        
+        if state is None:
+            # Cached as plain arrays only, so loading a shared Redis entry never unpickles
+            # Single pass over the projects; each index is then built from its feature column
+            features = [self._featurize_project(project) for project in projects]
+            idf_columns, idf_values, project_counts = self._fit_vectorizer([f[0] for f in features])
+            keyword_terms, keyword_matrix = self._fit_keyword_index([f[1] for f in features])
+            tech_terms, tech_bits = self._fit_tech_index([f[2] for f in features])
+            state = {
+                "idf_columns": idf_columns,
+                "idf_values": idf_values,
+                **_sparse_to_arrays("project_counts", project_counts),
+                "keyword_terms": np.array(keyword_terms, dtype=str),
+                **_sparse_to_arrays("keyword_matrix", keyword_matrix),
+                "tech_terms": np.array(tech_terms, dtype=str),
+                "tech_bits": tech_bits,
+            }
+            if self.cache_service:
+                self.cache_service.cache_model(model_key, state)
+        
+        idf = np.zeros(self.hasher.n_features, dtype=np.float32)
+        idf[state["idf_columns"]] = state["idf_values"]
+        keyword_terms = state["keyword_terms"].tolist()
+        tech_terms = state["tech_terms"].tolist()
+        
+        return _FittedState(
+            fingerprint=fingerprint,
+            idf=idf,
+            project_matrix=self._weight_counts(_sparse_from_arrays("project_counts", state, csr_matrix), idf),
+            keyword_terms=keyword_terms,
+            keyword_vocab={term: i for i, term in enumerate(keyword_terms)},
+            keyword_matrix=_sparse_from_arrays("keyword_matrix", state, csc_matrix),
+            tech_terms=tech_terms,
+            tech_vocab={term: i for i, term in enumerate(tech_terms)},
+            tech_bits=state["tech_bits"],
         )
+    
+    def _fit_vectorizer(self, project_documents: List[str]):
+        """
+        Hash the project corpus and fit IDF weights on it.
+        
+        Returns (idf_columns, idf_values, project_counts): the hashed features with a non-zero
+        IDF and their weights, plus the raw hashed counts. Only a few hundred of the 2^18
+        features occur in a user's projects, so the cached model stays small.
+        """
+        project_counts = self.hasher.transform(project_documents)
+        doc_freq = np.bincount(project_counts.indices, minlength=project_counts.shape[1])
+        
+        idf = self._idf_from_doc_freq(doc_freq, len(project_documents))
+        idf_columns = np.flatnonzero(idf).astype(np.int32)
+        
+        return idf_columns, idf[idf_columns], project_counts
+    
+    def _idf_from_doc_freq(self, doc_freq: np.ndarray, n_docs: int) -> np.ndarray:
+        """Smoothed IDF (as TfidfTransformer computes it) with unusable features zeroed."""
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+        
+        # Terms no project uses carry no signal, only inflate the job vector's norm
+        idf[doc_freq == 0] = 0.0
+        
+        # Pruning corpus-wide terms only makes sense with a few projects to compare
+        if n_docs > 2:
+            idf[doc_freq > 0.8 * n_docs] = 0.0
+        
+        return idf.astype(np.float32)
+    
+    def _weight_counts(self, counts, idf: np.ndarray):
+        """Apply IDF weights and L2-normalise rows so similarity is a plain dot product."""
+        weighted = counts.tocsr(copy=True)
+        weighted.data *= idf[weighted.indices]
+        weighted.eliminate_zeros()
+        return normalize(weighted, norm='l2', copy=False)
+    
+    def _fit_keyword_index(self, keyword_sets: List[frozenset]):
+        """
+        Build a binary project x term incidence matrix from per-project keyword sets.
+        
+        Returns (terms, matrix) where matrix is CSC so job-keyword columns can be sliced cheaply.
+        """
+        terms = sorted(set().union(*keyword_sets))
+        if not terms:
+            return [], None
         
-        # Fit and transform documents
-        tfidf_matrix = self.vectorizer.fit_transform(all_documents)
+        vocab = {term: i for i, term in enumerate(terms)}
+        indptr = np.cumsum([0] + [len(keywords) for keywords in keyword_sets])
+        indices = np.fromiter(
+            (vocab[term] for keywords in keyword_sets for term in keywords),
+            dtype=np.int32,
+            count=indptr[-1]
+        )
+        keyword_matrix = csr_matrix(
+            (np.ones(len(indices), dtype=np.int64), indices, indptr),
+            shape=(len(keyword_sets), len(terms))
+        )
         
-        # Calculate cosine similarity between projects and job
-        job_vector = tfidf_matrix[-1]  # Last document is the job
-        project_vectors = tfidf_matrix[:-1]  # All except last are projects
+        return terms, keyword_matrix.tocsc()
+    
+    def _calculate_tfidf_similarity(self, state: _FittedState, job_document: str) -> np.ndarray:
+        """Calculate TF-IDF cosine similarity between the fitted projects and a job."""
         
-        similarities = cosine_similarity(project_vectors, job_vector.reshape(1, -1))
+        job_vector = self._weight_counts(self.hasher.transform([job_document]), state.idf)
         
-        return similarities.flatten().tolist()
+        # Rows are unit length, so cosine similarity is a single sparse matvec
+        return (state.project_matrix @ job_vector.T).toarray().ravel()
     
     def _calculate_keyword_matches(
         self, 
-        projects: List[Project], 
-        job_context: JobContext
-    ) -> List[Dict[str, Any]]:
-        """Calculate keyword-based matches with explanations."""
+        state: _FittedState,
+        job_context: JobContext,
+        n_projects: int
+    ) -> Tuple[np.ndarray, Tuple[Optional[csr_matrix], List[int]]]:
+        """
+        Calculate keyword-based matches.
+        
+        Returns (scores, hits): a score per project and the (matched, columns) pair that
+        _matched_keywords reads a project's matched keywords from.
+        """
         
         # Extract keywords from job
         job_keywords = self._extract_keywords(
             f"{job_context.title} {job_context.description}"
         )
         
-        results = []
-        for project in projects:
-            project_text = f"{project.title} {project.description} "
-            project_keywords = self._extract_keywords(project_text)
-            
-            # Find matching keywords
-            matching_keywords = list(job_keywords.intersection(project_keywords))
-            
-            # Calculate score based on matches
-            if job_keywords:
-                score = len(matching_keywords) / len(job_keywords)
-            else:
-                score = 0.0
-            
-            results.append({
-                'score': min(score, 1.0),  # Cap at 1.0
-                'keywords': matching_keywords,
-                'total_job_keywords': len(job_keywords),
-                'matched_count': len(matching_keywords)
-            })
+        # Slice the fitted incidence matrix down to the job's keywords in one go
+        columns = [state.keyword_vocab[w] for w in job_keywords if w in state.keyword_vocab]
+        if columns and state.keyword_matrix is not None:
+            matched = state.keyword_matrix[:, columns].tocsr()
+            matched_counts = np.asarray(matched.sum(axis=1)).ravel()
+        else:
+            matched = None
+            matched_counts = np.zeros(n_projects)
         
-        return results
+        # Score is the share of job keywords found, capped at 1.0
+        if job_keywords:
+            scores = np.minimum(matched_counts / len(job_keywords), 1.0)
+        else:
+            scores = np.zeros(n_projects)
+        
+        return scores, (matched, columns)
+    
+    def _matched_keywords(
+        self,
+        state: _FittedState,
+        hits: Tuple[Optional[csr_matrix], List[int]],
+        i: int
+    ) -> List[str]:
+        """Recover one project's matched keywords from its row of the sliced incidence matrix."""
+        matched, columns = hits
+        if matched is None:
+            return []
+        return [state.keyword_terms[columns[j]] for j in matched.indices[matched.indptr[i]:matched.indptr[i + 1]]]
     
     def _calculate_technology_matches(
         self, 
-        projects: List[Project], 
-        job_context: JobContext
-    ) -> List[Dict[str, Any]]:
-        """Calculate technology-specific matches."""
+        state: _FittedState,
+        job_context: JobContext,
+        n_projects: int
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, frozenset]]:
+        """
+        Calculate technology-specific matches using the fitted project tech bitmasks.
         
-        all_job_techs = set()
-        required_techs = set([skill.lower() for skill in job_context.required_skills])
-        preferred_techs = set([skill.lower() for skill in job_context.preferred_skills])
-        all_job_techs.update(required_techs)
-        all_job_techs.update(preferred_techs)
+        Returns (scores, masks): a score per project and the job's (required, preferred,
+        required_techs) masks that _technology_details expands for a single project.
+        """
         
-        results = []
-        for project in projects:
-            project_techs = set()
-            if project.technologies:
-                project_techs.update([tech.lower() for tech in project.technologies])
-            if project.skills_demonstrated:
-                project_techs.update([skill.lower() for skill in project.skills_demonstrated])
-            
-            # Find matches
-            matched_required = project_techs.intersection(required_techs)
-            matched_preferred = project_techs.intersection(preferred_techs)
-            all_matched = project_techs.intersection(all_job_techs)
-            
-            # Calculate score
-            required_score = len(matched_required) / len(required_techs) if required_techs else 0
-            preferred_score = len(matched_preferred) / len(preferred_techs) if preferred_techs else 0
-            
-            # Weight required skills higher
-            tech_score = (required_score * 0.7) + (preferred_score * 0.3)
-            
-            results.append({
-                'score': min(tech_score, 1.0),
-                'technologies': list(all_matched),
-                'required_matches': list(matched_required),
-                'preferred_matches': list(matched_preferred),
-                'missing_required': list(required_techs - matched_required)
-            })
+        # Normalise once, before any per-project work
+        required_techs = frozenset(skill.lower() for skill in job_context.required_skills)
+        preferred_techs = frozenset(skill.lower() for skill in job_context.preferred_skills)
         
-        return results
-    
-    def _extract_keywords(self, text: str) -> Set[str]:
-        """Extract meaningful keywords from text."""
-        text = text.lower()
-        # Remove special characters and split
-        words = re.findall(r'\b\w{3,}\b', text)
-        
-        # Filter out stop words and common terms
-        keywords = set()
-        for word in words:
-            if (word not in self.stop_words and 
-                len(word) >= 3 and 
-                not word.isdigit()):
-                keywords.add(word)
-        
-        return keywords
-    
-    def _get_custom_stop_words(self) -> Set[str]:
-        """Get custom stop words for technical content."""
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 
-            'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'how', 
-            'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 
-            'its', 'let', 'put', 'say', 'she', 'too', 'use', 'will', 'about',
-            'after', 'again', 'against', 'all', 'also', 'any', 'because', 'been',
-            'before', 'being', 'between', 'both', 'each', 'few', 'from', 'have',
-            'here', 'into', 'more', 'most', 'only', 'other', 'some', 'such',
-            'than', 'that', 'the', 'their', 'them', 'these', 'they', 'this',
-            'through', 'very', 'were', 'what', 'when', 'where', 'which', 'while',
-            'with', 'would', 'your'
-        }
-        return stop_words
+        req_bits = self._tech_mask(state, required_techs)
+        pref_bits = self._tech_mask(state, preferred_techs)
+        
+        # AND + popcount across every project at once
+        req_counts = _POPCOUNT8[state.tech_bits & req_bits].sum(axis=1)
+        pref_counts = _POPCOUNT8[state.tech_bits & pref_bits].sum(axis=1)
+        
+        required_score = req_counts / len(required_techs) if required_techs else np.zeros(n_projects)
+        preferred_score = pref_counts / len(preferred_techs) if preferred_techs else np.zeros(n_projects)
+        
+        # Weight required skills higher
+        tech_scores = np.minimum(required_score * 0.7 + preferred_score * 0.3, 1.0)
+        
+        return tech_scores, (req_bits, pref_bits, required_techs)
     
-    def _load_technology_keywords(self) -> Dict[str, List[str]]:
-        """Load technology keyword mappings for better matching."""
+    def _technology_details(
+        self,
+        state: _FittedState,
+        masks: Tuple[np.ndarray, np.ndarray, frozenset],
+        i: int
+    ) -> Dict[str, Any]:
+        """Matched and missing technologies for one project."""
+        req_bits, pref_bits, required_techs = masks
+        project_bits = state.tech_bits[i]
+        matched_required = self._tech_names(state, project_bits & req_bits)
+        
         return {
-            'web_development': [
-                'react', 'angular', 'vue', 'javascript', 'typescript', 'html', 'css',
-                'node', 'express', 'django', 'flask', 'fastapi', 'spring'
-            ],
-            'mobile_development': [
-                'android', 'ios', 'flutter', 'react-native', 'swift', 'kotlin', 'xamarin'
-            ],
-            'machine_learning': [
-                'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'opencv',
-                'keras', 'xgboost', 'ml', 'ai', 'deep-learning', 'neural-network'
-            ],
-            'data_science': [
-                'python', 'r', 'sql', 'tableau', 'powerbi', 'jupyter', 'matplotlib',
-                'seaborn', 'plotly', 'statistics', 'analytics'
-            ],
-            'cloud_devops': [
-                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform',
-                'ansible', 'ci-cd', 'devops'
-            ]
+            'technologies': self._tech_names(state, project_bits & (req_bits | pref_bits)),
+            'required_matches': matched_required,
+            'preferred_matches': self._tech_names(state, project_bits & pref_bits),
+            'missing_required': list(required_techs.difference(matched_required))
         }
     
+    def _fit_tech_index(self, project_techs: List[frozenset]):
+        """
+        Build packed per-project technology bitmasks over the project tech vocabulary.
+        
+        Returns (terms, bits) where bits has shape (n_projects, ceil(V / 8)) and dtype uint8.
+        """
+        terms = sorted(set().union(*project_techs))
+        vocab = {term: i for i, term in enumerate(terms)}
+        
+        incidence = np.zeros((len(project_techs), max(len(terms), 1)), dtype=bool)
+        for row, techs in enumerate(project_techs):
+            incidence[row, [vocab[t] for t in techs]] = True
+        
+        return terms, np.packbits(incidence, axis=1)
+    
+    def _tech_mask(self, state: _FittedState, techs: Set[str]) -> np.ndarray:
+        """Pack a set of lower-cased technologies into a bitmask over the fitted vocabulary."""
+        mask = np.zeros(max(len(state.tech_terms), 1), dtype=bool)
+        mask[[state.tech_vocab[t] for t in techs if t in state.tech_vocab]] = True
+        return np.packbits(mask)
+    
+    def _tech_names(self, state: _FittedState, bits: np.ndarray) -> List[str]:
+        """Unpack a bitmask row back into technology names."""
+        return [state.tech_terms[i] for i in np.flatnonzero(np.unpackbits(bits)[:len(state.tech_terms)])]
+    
+    def _extract_keywords(self, text: str) -> Set[str]:
+        """Extract meaningful keywords from text."""
+        return _extract_keywords(text, self.stop_words)
+    
     def get_algorithm_name(self) -> str:
         return "TF-IDF + Keyword Matching"
     
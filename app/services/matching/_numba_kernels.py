@@ -0,0 +1,34 @@
+"""
+Numeric kernels for project matching.
+
+Compiled with numba when it is installed; otherwise the same functions fall back
+to plain NumPy so the matcher works without the optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def combine_scores(tfidf, kw, tech, w_tfidf, w_kw, w_tech):
+        """Weighted sum of the component scores, clipped to [0, 1], in one pass."""
+        n = tfidf.shape[0]
+        out = np.empty(n)
+        for i in range(n):
+            s = w_tfidf * tfidf[i] + w_kw * kw[i] + w_tech * tech[i]
+            if s > 1.0:
+                s = 1.0
+            elif s < 0.0:
+                s = 0.0
+            out[i] = s
+        return out
+else:
+    def combine_scores(tfidf, kw, tech, w_tfidf, w_kw, w_tech):
+        """Weighted sum of the component scores, clipped to [0, 1]."""
+        return np.clip(w_tfidf * tfidf + w_kw * kw + w_tech * tech, 0.0, 1.0)
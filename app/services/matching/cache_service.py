@@ -1,28 +1,100 @@
 """
 Caching service for project matching results.
+
+Cache keys hash the job context with xxh3_128 when ``xxhash`` is installed.
+MD5 is only kept as a fallback for environments where xxhash cannot be
+installed; keys are not security sensitive, but they differ between the two,
+so mixing hosts with and without xxhash on one Redis just lowers the hit rate.
 """
 
+import io
 import json
 import hashlib
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import os
+import queue
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+from datetime import datetime
+import numpy as np
+from cachetools import TLRUCache
 from loguru import logger
 
+from .base_matcher import MatchResult, JobContext
+
 try:
     import redis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
 
-from .base_matcher import MatchResult, JobContext
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(data: Any, sort_keys: bool = False) -> bytes:
+        """Serialize to JSON bytes (orjson)."""
+        option = _ORJSON_OPTS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTS
+        return orjson.dumps(data, option=option)
+
+    _loads = orjson.loads
+else:
+    def _dumps(data: Any, sort_keys: bool = False) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback)."""
+        return json.dumps(data, sort_keys=sort_keys).encode()
+
+    _loads = json.loads
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Every zstd frame starts with these bytes; JSON and .npz payloads never do
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _pack_arrays(arrays: Dict[str, np.ndarray]) -> bytes:
+    """Serialize named numpy arrays as an .npz archive."""
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _unpack_arrays(payload: bytes) -> Dict[str, np.ndarray]:
+    """Load an .npz archive; object arrays are refused so a Redis payload can't run code."""
+    with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def _entry_expiry(key: str, entry: Tuple[int, Any], now: float) -> float:
+    """TLRUCache time-to-use: memory entries are stored as (ttl, value)."""
+    return now + entry[0]
+
 
 class MatchingCacheService:
     """Service for caching project matching results."""
     
     def __init__(self, redis_url: str = None, default_ttl: int = 3600):
         self.default_ttl = default_ttl  # 1 hour default
-        self.memory_cache = {}  # Fallback memory cache
+        # Fallback memory cache; entries are (ttl, value) so each write keeps its own TTL
+        self.memory_cache = TLRUCache(maxsize=10000, ttu=_entry_expiry)
+        self._user_index: Dict[str, Set[str]] = {}  # user_id -> memory cache keys
+        self._index_writes = 0  # Index additions since the last sweep of expired/evicted keys
         self.redis_client = None
+        # zstd contexts are reused across writes but are not thread-safe, so each thread keeps its own
+        self._zstd = threading.local()
         
         if REDIS_AVAILABLE and redis_url:
             try:
@@ -31,8 +103,21 @@ class MatchingCacheService:
                 logger.info("Redis cache connected successfully")
             except Exception as e:
                 logger.warning(f"Redis connection failed, using memory cache: {e}")
+                self.redis_client = None
         else:
             logger.info("Using memory cache for matching results")
+        
+        # Write-behind queue so Redis writes stay off the request path
+        self._write_q = queue.Queue(maxsize=1024)
+        if self.redis_client:
+            self._start_writer()
+            # Threads do not survive fork (gunicorn --preload workers): restart the writer in the child
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=self._start_writer)
+    
+    def _start_writer(self):
+        """Start the background thread that flushes queued Redis writes."""
+        threading.Thread(target=self._writer_loop, name="match-cache-writer", daemon=True).start()
     
     def generate_cache_key(
         self, 
@@ -53,9 +138,11 @@ class MatchingCacheService:
             'category': job_context.category
         }
         
-        job_hash = hashlib.md5(
-            json.dumps(job_data, sort_keys=True).encode()
-        ).hexdigest()[:12]
+        payload = _dumps(job_data, sort_keys=True)
+        if XXHASH_AVAILABLE:
+            job_hash = xxhash.xxh3_128(payload).hexdigest()[:12]
+        else:
+            job_hash = hashlib.md5(payload).hexdigest()[:12]
         
         return f"match:{user_id}:{job_hash}:{algorithm_name}:{algorithm_version}"
     
@@ -67,19 +154,15 @@ class MatchingCacheService:
                 # Try Redis first
                 cached_data = self.redis_client.get(cache_key)
                 if cached_data:
-                    results = json.loads(cached_data)
+                    results = _loads(self._decompress(cached_data))
                     logger.info(f"Cache hit (Redis): {cache_key}")
                     return results
             
-            # Fallback to memory cache
-            if cache_key in self.memory_cache:
-                cache_entry = self.memory_cache[cache_key]
-                if datetime.now() < cache_entry['expires_at']:
-                    logger.info(f"Cache hit (Memory): {cache_key}")
-                    return cache_entry['data']
-                else:
-                    # Expired, remove from memory cache
-                    del self.memory_cache[cache_key]
+            # Fallback to memory cache (expired entries are evicted by TLRUCache)
+            results = self._memory_get(cache_key)
+            if results is not None:
+                logger.info(f"Cache hit (Memory): {cache_key}")
+                return results
             
             logger.info(f"Cache miss: {cache_key}")
             return None
@@ -114,22 +197,12 @@ class MatchingCacheService:
                 serializable_results.append(serializable_result)
             
             if self.redis_client:
-                # Cache in Redis
-                self.redis_client.setex(
-                    cache_key, 
-                    ttl, 
-                    json.dumps(serializable_results)
-                )
-                logger.info(f"Cached results in Redis: {cache_key}")
+                # Cache in Redis (write-behind)
+                self._write_redis(cache_key, ttl, self._compress(_dumps(serializable_results)))
             
             # Also cache in memory as backup
-            self.memory_cache[cache_key] = {
-                'data': serializable_results,
-                'expires_at': datetime.now() + timedelta(seconds=ttl)
-            }
-            
-            # Clean up old memory cache entries
-            self._cleanup_memory_cache()
+            self.memory_cache[cache_key] = (ttl, serializable_results)
+            self._index_key(cache_key)
             
             return True
             
@@ -137,6 +210,44 @@ class MatchingCacheService:
             logger.error(f"Error caching results: {e}")
             return False
     
+    def get_cached_model(self, model_key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Retrieve a fitted model stored as named numpy arrays (e.g. TF-IDF weights + matrices)."""
+        
+        try:
+            if self.redis_client:
+                cached_data = self.redis_client.get(model_key)
+                if cached_data:
+                    logger.info(f"Model cache hit (Redis): {model_key}")
+                    return _unpack_arrays(self._decompress(cached_data))
+            
+            model = self._memory_get(model_key)
+            if model is not None:
+                logger.info(f"Model cache hit (Memory): {model_key}")
+                return model
+            
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error retrieving model from cache: {e}")
+            return None
+    
+    def cache_model(self, model_key: str, model: Dict[str, np.ndarray], ttl: int = None) -> bool:
+        """Cache a fitted model, given as named plain (non-object) numpy arrays, so worker restarts can reuse it."""
+        
+        ttl = ttl or self.default_ttl
+        
+        try:
+            if self.redis_client:
+                self._write_redis(model_key, ttl, self._compress(_pack_arrays(model)))
+            
+            self.memory_cache[model_key] = (ttl, model)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error caching model: {e}")
+            return False
+    
     def invalidate_user_cache(self, user_id: str) -> int:
         """Invalidate all cached results for a user."""
         
@@ -144,22 +255,28 @@ class MatchingCacheService:
         
         try:
             if self.redis_client:
-                # Find and delete Redis keys
+                # Walk matching keys with SCAN (non-blocking) and UNLINK them in one pipeline
                 pattern = f"match:{user_id}:*"
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    invalidated_count += self.redis_client.delete(*keys)
-                    logger.info(f"Invalidated {len(keys)} Redis cache entries for user {user_id}")
+                pipe = self.redis_client.pipeline(transaction=False)
+                redis_count = 0
+                cursor = 0
+                while True:
+                    cursor, batch = self.redis_client.scan(cursor=cursor, match=pattern, count=500)
+                    if batch:
+                        pipe.unlink(*batch)
+                        redis_count += len(batch)
+                    if cursor == 0:
+                        break
+                
+                if redis_count:
+                    pipe.execute()
+                    invalidated_count += redis_count
+                    logger.info(f"Invalidated {redis_count} Redis cache entries for user {user_id}")
             
-            # Clean memory cache
-            keys_to_delete = [
-                key for key in self.memory_cache.keys() 
-                if key.startswith(f"match:{user_id}:")
-            ]
-            
-            for key in keys_to_delete:
-                del self.memory_cache[key]
-                invalidated_count += 1
+            # Clean memory cache via the per-user key index
+            for key in self._user_index.pop(user_id, set()):
+                if self.memory_cache.pop(key, None) is not None:
+                    invalidated_count += 1
             
             logger.info(f"Invalidated {invalidated_count} total cache entries for user {user_id}")
             return invalidated_count
@@ -168,20 +285,86 @@ class MatchingCacheService:
             logger.error(f"Error invalidating user cache: {e}")
             return 0
     
-    def _cleanup_memory_cache(self):
-        """Clean up expired entries from memory cache."""
+    def _write_redis(self, key: str, ttl: int, payload: bytes):
+        """Queue a Redis write for the background writer, writing inline if the queue is full."""
         
-        now = datetime.now()
-        expired_keys = [
-            key for key, entry in self.memory_cache.items()
-            if now >= entry['expires_at']
-        ]
+        try:
+            self._write_q.put_nowait((key, ttl, payload))
+        except queue.Full:
+            self.redis_client.setex(key, ttl, payload)
+            logger.info(f"Cached in Redis (write queue full): {key}")
+    
+    def _writer_loop(self):
+        """Drain queued writes and flush them to Redis in pipelined batches."""
         
-        for key in expired_keys:
-            del self.memory_cache[key]
+        while True:
+            batch = [self._write_q.get()]
+            while len(batch) < 32:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, ttl, payload in batch:
+                    pipe.setex(key, ttl, payload)
+                pipe.execute()
+                logger.info(f"Cached {len(batch)} entries in Redis")
+            except Exception as e:
+                logger.error(f"Error writing cache batch to Redis: {e}")
+    
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress a Redis payload with zstd when available."""
+        if not ZSTD_AVAILABLE:
+            return payload
+        
+        compressor = getattr(self._zstd, "compressor", None)
+        if compressor is None:
+            compressor = self._zstd.compressor = zstd.ZstdCompressor(level=3)
+        return compressor.compress(payload)
+    
+    def _decompress(self, payload: bytes) -> bytes:
+        """Decompress zstd payloads; uncompressed (older) entries pass through."""
+        if payload[:4] != _ZSTD_MAGIC:
+            return payload
+        
+        decompressor = getattr(self._zstd, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._zstd.decompressor = zstd.ZstdDecompressor()
+        return decompressor.decompress(payload)
+    
+    def _memory_get(self, key: str) -> Optional[Any]:
+        """Look up a memory cache value, unwrapping its (ttl, value) entry."""
+        
+        entry = self.memory_cache.get(key)
+        return entry[1] if entry is not None else None
+    
+    def _index_key(self, cache_key: str):
+        """
+        Record a memory cache key under its user for invalidate_user_cache.
+        
+        TLRUCache drops expired and evicted keys without telling us, so every maxsize
+        additions the index is swept down to keys still in the cache. That bounds it to
+        twice the cache size at a constant amortised cost per write.
+        """
+        self._user_index.setdefault(self._key_user_id(cache_key), set()).add(cache_key)
+        self._index_writes += 1
+        
+        if self._index_writes >= self.memory_cache.maxsize:
+            self._index_writes = 0
+            live = self.memory_cache
+            self._user_index = {
+                user_id: alive
+                for user_id, keys in self._user_index.items()
+                if (alive := {key for key in keys if key in live})
+            }
+    
+    @staticmethod
+    def _key_user_id(cache_key: str) -> str:
+        """Extract the user ID from a ``match:{user_id}:...`` cache key."""
         
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+        return cache_key.split(":", 2)[1]
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
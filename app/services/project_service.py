@@ -62,6 +62,7 @@ class ProjectService:
             if "project_type" in filters:
                 query = query.filter(Project.project_type == filters["project_type"])
             if "technology" in filters:
+                # ARRAY containment compiles to `technologies @> ARRAY[...]`, served by the GIN index
                 query = query.filter(Project.technologies.contains([filters["technology"]]))
         
         return query.offset(offset).limit(limit).all()
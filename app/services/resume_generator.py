@@ -4,26 +4,106 @@ Supports LaTeX and ReportLab PDF generation with proper error handling.
 """
 
 import os
+import functools
+import importlib.util
+import multiprocessing
+import multiprocessing.util
+import queue
 import subprocess
 import tempfile
 import shutil
+import string
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from jinja2 import Environment, FileSystemLoader
+from typing import ClassVar, Dict, Any, FrozenSet, Optional, List, Tuple, Union
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 from loguru import logger
 import uuid
 from datetime import datetime
+from itertools import chain, islice
+from types import SimpleNamespace
 
-try:
+# Fallback backends are only imported when a fallback is actually used
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+WEASYPRINT_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+
+if not REPORTLAB_AVAILABLE:
+    logger.warning("ReportLab not installed - only LaTeX generation available")
+
+
+@functools.lru_cache(maxsize=None)
+def _reportlab() -> SimpleNamespace:
+    """Import the ReportLab pieces used by the fallback generator (once)."""
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    logger.warning("ReportLab not installed - only LaTeX generation available")
+    
+    return SimpleNamespace(
+        letter=letter,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        getSampleStyleSheet=getSampleStyleSheet,
+        ParagraphStyle=ParagraphStyle,
+        inch=inch,
+        colors=colors,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _weasyprint():
+    """Import WeasyPrint (once)."""
+    import weasyprint
+    return weasyprint
+
+
+# LaTeX special characters and their escaped forms, applied in one C-level pass
+_LATEX_ESCAPE = str.maketrans({
+    "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+    "_": r"\_", "{": r"\{", "}": r"\}",
+    "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+    "\\": r"\textbackslash{}",
+})
+
+
+def _latex_escape(value: Any) -> str:
+    """Escape LaTeX special characters in a template value (Jinja filter ``ltx``)."""
+    if value is None:
+        return ""
+    return str(value).translate(_LATEX_ESCAPE)
+
+
+# Filename-safe user names in one pass: lower-case ASCII, spaces to underscores,
+# and drop path separators and other characters filesystems reject
+_NAME_SANITIZE = {ord(c): ord(c) + 32 for c in string.ascii_uppercase}
+_NAME_SANITIZE[ord(" ")] = ord("_")
+_NAME_SANITIZE.update({ord(c): None for c in '/\\:;,*?"<>|'})
+
+
+@functools.lru_cache(maxsize=1)
+def _latex_available() -> bool:
+    """Check once per process whether LaTeX (pdflatex) is available on the system."""
+    try:
+        result = subprocess.run(
+            ["pdflatex", "--version"], 
+            capture_output=True, 
+            text=True, 
+            timeout=10
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+def _remove_workdir_pool(pool_root: Path, owner_pid: int):
+    """Delete a LaTeX workdir pool, but only from the process that created it."""
+    # Forked children (gunicorn --preload workers) inherit the exit hook; they must not
+    # delete a pool that belongs to their parent or a sibling
+    if os.getpid() == owner_pid:
+        shutil.rmtree(pool_root, ignore_errors=True)
 
 
 class ResumeGenerationError(Exception):
@@ -34,6 +114,24 @@ class ResumeGenerationError(Exception):
 class ResumeGenerator:
     """Production resume generator with multiple PDF backends."""
     
+    WORKDIR_POOL_SIZE = 4  # Concurrent LaTeX compilations per generator
+    
+    # Placeholder contact details used when the user did not provide them
+    _DEFAULTS: ClassVar[Dict[str, str]] = {
+        "name": "Firstname Lastname",
+        "phone": "+1(123) 456-7890",
+        "location": "San Francisco, CA",
+        "email": "contact@example.com",
+        "linkedin_url": "https://linkedin.com/in/profile",
+        "linkedin_display": "linkedin.com/in/profile",
+        "website_url": "www.example.com",
+        "website_display": "www.example.com",
+    }
+    _KEYS: ClassVar[FrozenSet[str]] = frozenset(_DEFAULTS)
+    
+    # Resume sections that default to empty
+    _SECTION_KEYS: ClassVar[Tuple[str, ...]] = ("education", "skills", "experience", "extra_curricular", "leadership")
+    
     def __init__(self):
         self.template_dir = Path("app/templates")
         self.output_dir = Path("app/generated/resumes")
@@ -42,25 +140,103 @@ class ResumeGenerator:
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,  # Templates ship with the app; skip per-render mtime checks
+            cache_size=-1
         )
+        self.jinja_env.filters["ltx"] = _latex_escape
+        
+        # Compile templates once; rendering is then a single .render() call
+        try:
+            self._tex_template = self.jinja_env.get_template("resume_template.tex")
+        except TemplateNotFound:
+            logger.warning("LaTeX resume template not found - LaTeX generation disabled")
+            self._tex_template = None
+        
+        try:
+            self._html_template = self.jinja_env.get_template("resume.html.j2")
+        except TemplateNotFound:
+            logger.warning("HTML resume template not found - WeasyPrint generation disabled")
+            self._html_template = None
         
         self.latex_available = self._check_latex_availability()
         
+        # Reusable LaTeX scratch dirs, each with resume.cls already in place. Created
+        # lazily per process so forked workers never share (or delete) another's dirs
+        self._workdir_pool: Optional[queue.Queue] = None
+        self._workdir_pid: Optional[int] = None
+        self._workdir_lock = threading.Lock()
+        
+        self._process_pool: Optional[ProcessPoolExecutor] = None  # Created on first bulk request
+        self._process_pool_lock = threading.Lock()  # Bulk requests run on executor threads
+        self._rl_styles = None  # ReportLab styles, built on first fallback use
+        
         logger.info(f"Resume generator ready - LaTeX: {self.latex_available}, ReportLab: {REPORTLAB_AVAILABLE}")
     
     def _check_latex_availability(self) -> bool:
         """Check if LaTeX (pdflatex) is available on the system."""
-        try:
-            result = subprocess.run(
-                ["pdflatex", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return _latex_available()
+    
+    def _init_reportlab_styles(self):
+        """Build the ReportLab stylesheet and custom styles once; they never change."""
+        
+        rl = _reportlab()
+        ParagraphStyle, colors = rl.ParagraphStyle, rl.colors
+        
+        self._rl_styles = rl.getSampleStyleSheet()
+        
+        self._rl_title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self._rl_styles['Heading1'],
+            fontSize=18,
+            spaceAfter=12,
+            alignment=1,  # Center alignment
+            textColor=colors.black
+        )
+        
+        self._rl_heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=self._rl_styles['Heading2'],
+            fontSize=12,
+            spaceAfter=6,
+            textColor=colors.black,
+            borderWidth=1,
+            borderColor=colors.black,
+            borderPadding=3
+        )
+        
+        self._rl_normal_style = self._rl_styles['Normal']
+    
+    def _get_workdir_pool(self) -> queue.Queue:
+        """Return this process's LaTeX workdir pool, creating it on first use."""
+        pid = os.getpid()
+        if self._workdir_pid != pid:
+            with self._workdir_lock:
+                if self._workdir_pid != pid:
+                    self._init_workdir_pool()
+                    self._workdir_pid = pid
+        return self._workdir_pool
+    
+    def _init_workdir_pool(self):
+        """Create the LaTeX working directories, linking resume.cls into each."""
+        
+        pool_root = Path(tempfile.mkdtemp(prefix="applybot_latex_"))
+        # multiprocessing finalizers run at interpreter exit and also when a pool worker
+        # process exits, which skips atexit handlers
+        multiprocessing.util.Finalize(None, _remove_workdir_pool, args=(pool_root, os.getpid()), exitpriority=0)
+        
+        self._workdir_pool = queue.Queue()
+        cls_source = (self.template_dir / "resume.cls").resolve()
+        for i in range(self.WORKDIR_POOL_SIZE):
+            workdir = pool_root / f"wd{i}"
+            workdir.mkdir()
+            if cls_source.exists():
+                try:
+                    os.symlink(cls_source, workdir / "resume.cls")
+                except OSError:
+                    # No symlink support (e.g. Windows without privileges) - copy once instead
+                    shutil.copy2(cls_source, workdir / "resume.cls")
+            self._workdir_pool.put(workdir)
     
     def generate_resume(
     self,
@@ -123,6 +299,51 @@ class ResumeGenerator:
             raise ResumeGenerationError(f"Failed to generate resume: {str(e)}")
 
     
+    def generate_resumes_bulk(
+        self,
+        requests: List[Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]], Optional[str]]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate several resumes in parallel in worker processes.
+        
+        Args:
+            requests: (user_data, selected_projects, job_context, job_id) per resume
+            
+        Returns:
+            One entry per request, in order: the generate_resume result, or the exception raised
+        """
+        process_pool = self._get_process_pool()
+        futures = [process_pool.submit(_generate_one, request) for request in requests]
+        
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        
+        return results
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the bulk-generation process pool, creating it once on first use."""
+        if self._process_pool is None:
+            with self._process_pool_lock:
+                if self._process_pool is None:
+                    # Spawned (not forked) workers: forking a threaded server can copy held locks.
+                    # Each worker imports this module fresh, so it gets its own generator and workdirs
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.WORKDIR_POOL_SIZE,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._process_pool
+    
+    def shutdown(self):
+        """Stop the bulk-generation worker processes (called on application shutdown)."""
+        with self._process_pool_lock:
+            process_pool, self._process_pool = self._process_pool, None
+        if process_pool is not None:
+            process_pool.shutdown(wait=True, cancel_futures=True)
+    
     def _prepare_template_data(
         self, 
         user_data: Dict[str, Any], 
@@ -131,24 +352,10 @@ class ResumeGenerator:
     ) -> Dict[str, Any]:
         """Prepare data for template rendering."""
         
-        # Default user data structure
-        template_data = {
-            "name": user_data.get("name", "Firstname Lastname"),
-            "phone": user_data.get("phone", "+1(123) 456-7890"),
-            "location": user_data.get("location", "San Francisco, CA"),
-            "email": user_data.get("email", "contact@example.com"),
-            "linkedin_url": user_data.get("linkedin_url", "https://linkedin.com/in/profile"),
-            "linkedin_display": user_data.get("linkedin_display", "linkedin.com/in/profile"),
-            "website_url": user_data.get("website_url", "www.example.com"),
-            "website_display": user_data.get("website_display", "www.example.com"),
-            "objective": self._generate_objective(user_data, job_context),
-            "education": user_data.get("education", []),
-            "skills": user_data.get("skills", []),
-            "experience": user_data.get("experience", []),
-            "projects": selected_projects or user_data.get("projects", []),
-            "extra_curricular": user_data.get("extra_curricular", []),
-            "leadership": user_data.get("leadership", [])
-        }
+        template_data = {**self._DEFAULTS, **{k: user_data[k] for k in self._KEYS & user_data.keys()}}
+        template_data["objective"] = self._generate_objective(user_data, job_context)
+        template_data.update({k: user_data.get(k, []) for k in self._SECTION_KEYS})
+        template_data["projects"] = selected_projects or user_data.get("projects", [])
         
         return template_data
     
@@ -159,56 +366,50 @@ class ResumeGenerator:
     ) -> str:
         """Generate objective statement based on user data and job context."""
         
-        experience_years = user_data.get("experience_years", "2+")
-        skills = user_data.get("primary_skills", ["Software Development"])
-        
-        if job_context:
-            job_title = job_context.get("title", "Software Engineer")
-            # Extract key technologies from job description
-            job_skills = job_context.get("requirements", [])[:3]  # Top 3 skills
-            skills_text = ", ".join(job_skills) if job_skills else ", ".join(skills)
+        # Top 3 job requirements when available, otherwise the user's primary skills
+        requirements = job_context.get("requirements") if job_context else None
+        if requirements:
+            skills_text = ", ".join(islice(requirements, 3))
         else:
-            job_title = "Software Engineer"
-            skills_text = ", ".join(skills)
+            skills_text = ", ".join(user_data.get("primary_skills", ("Software Development",)))
+        
+        job_title = (job_context or {}).get("title", "Software Engineer")
         
-        return f"Software Engineer with {experience_years} years of experience in {skills_text}, seeking full-time {job_title} roles."
+        return f"Software Engineer with {user_data.get('experience_years', '2+')} years of experience in {skills_text}, seeking full-time {job_title} roles."
     
     def _generate_with_latex(self, resume_id: str, template_data: Dict[str, Any]) -> Path:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Copy resume.cls to temp directory
-            cls_source = self.template_dir / "resume.cls"
-            if cls_source.exists():
-                cls_dest = temp_path / "resume.cls"
-                shutil.copy2(cls_source, cls_dest)
-            
+        workdir_pool = self._get_workdir_pool()
+        temp_path = workdir_pool.get()
+        try:
             # Render LaTeX template
-            template = self.jinja_env.get_template("resume_template.tex")
-            latex_content = template.render(**template_data)
+            if self._tex_template is None:
+                raise ResumeGenerationError("LaTeX resume template not available")
+            latex_content = self._tex_template.render(**template_data)
             
             # Write LaTeX file
             tex_file = temp_path / f"resume_{resume_id}.tex"
-            tex_file.write_text(latex_content, encoding='utf-8')
+            tex_file.write_bytes(latex_content.encode('utf-8'))
             
             # Compile with pdflatex
             try:
-                # Run pdflatex twice for proper formatting
-                for _ in range(2):
-                    result = subprocess.run(
-                        ["pdflatex", "-interaction=nonstopmode", str(tex_file)],
-                        cwd=temp_path,
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-                    
-                    if result.returncode != 0:
-                        logger.error(f"pdflatex error: {result.stderr}")
-                        raise ResumeGenerationError(f"LaTeX compilation failed: {result.stderr}")
+                # The resume has no cross-references, so a single pass is enough
+                # Output is discarded; pdflatex writes the same transcript to the .log file
+                result = subprocess.run(
+                    ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", str(tex_file)],
+                    cwd=temp_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=30
+                )
+                
+                if result.returncode != 0:
+                    log_file = temp_path / f"resume_{resume_id}.log"
+                    details = log_file.read_text(encoding='utf-8', errors='replace')[-2000:] if log_file.exists() else ""
+                    logger.error(f"pdflatex error: {details}")
+                    raise ResumeGenerationError(f"LaTeX compilation failed: {details}")
                 
                 # UPDATED: Generate filename with proper format
-                user_name = template_data.get("name", "Unknown").replace(" ", "_").lower()
+                user_name = template_data.get("name", "Unknown").translate(_NAME_SANITIZE)
                 if "_" in resume_id:  # If resume_id contains job_id or is formatted
                     pdf_filename = f"{user_name}_{resume_id}.pdf"
                 else:
@@ -226,6 +427,11 @@ class ResumeGenerator:
                     
             except subprocess.TimeoutExpired:
                 raise ResumeGenerationError("LaTeX compilation timed out")
+        finally:
+            # Remove only this job's files; resume.cls stays for the next one
+            for leftover in temp_path.glob(f"resume_{resume_id}.*"):
+                leftover.unlink()
+            workdir_pool.put(temp_path)
 
     
     def _generate_with_fallback(self, resume_id: str, template_data: Dict[str, Any]) -> Path:
@@ -243,90 +449,80 @@ class ResumeGenerator:
         
         pdf_path = self.output_dir / f"resume_{resume_id}.pdf"
         
+        rl = _reportlab()
+        Paragraph, Spacer, inch = rl.Paragraph, rl.Spacer, rl.inch
+        
         # Create PDF document
-        doc = SimpleDocTemplate(
+        doc = rl.SimpleDocTemplate(
             str(pdf_path),
-            pagesize=letter,
+            pagesize=rl.letter,
             rightMargin=0.4*inch,
             leftMargin=0.4*inch,
             topMargin=0.4*inch,
             bottomMargin=0.4*inch
         )
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=12,
-            alignment=1,  # Center alignment
-            textColor=colors.black
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=12,
-            spaceAfter=6,
-            textColor=colors.black,
-            borderWidth=1,
-            borderColor=colors.black,
-            borderPadding=3
-        )
-        
-        normal_style = styles['Normal']
-        
-        # Build content
-        content = []
-        
-        # Name and contact info
-        content.append(Paragraph(template_data['name'].upper(), title_style))
-        content.append(Paragraph(f"{template_data['phone']} | {template_data['location']}", normal_style))
-        content.append(Paragraph(f"{template_data['email']} | {template_data['linkedin_display']} | {template_data['website_display']}", normal_style))
-        content.append(Spacer(1, 12))
-        
-        # Objective
-        content.append(Paragraph("OBJECTIVE", heading_style))
-        content.append(Paragraph(template_data['objective'], normal_style))
-        content.append(Spacer(1, 12))
+        # Styles are built once, on first use
+        if self._rl_styles is None:
+            self._init_reportlab_styles()
+        title_style = self._rl_title_style
+        heading_style = self._rl_heading_style
+        normal_style = self._rl_normal_style
+        
+        # Build content, one batched extend per section
+        content = [
+            # Name and contact info
+            Paragraph(template_data['name'].upper(), title_style),
+            Paragraph(f"{template_data['phone']} | {template_data['location']}", normal_style),
+            Paragraph(f"{template_data['email']} | {template_data['linkedin_display']} | {template_data['website_display']}", normal_style),
+            Spacer(1, 12),
+            
+            # Objective
+            Paragraph("OBJECTIVE", heading_style),
+            Paragraph(template_data['objective'], normal_style),
+            Spacer(1, 12),
+        ]
         
         # Education
         if template_data['education']:
             content.append(Paragraph("EDUCATION", heading_style))
-            for edu in template_data['education']:
-                edu_text = f"<b>{edu.get('degree', '')}</b>, {edu.get('institution', '')} - {edu.get('year', '')}"
-                content.append(Paragraph(edu_text, normal_style))
-                if edu.get('coursework'):
-                    content.append(Paragraph(f"Relevant Coursework: {edu['coursework']}", normal_style))
+            content.extend(chain.from_iterable(
+                [
+                    Paragraph(f"<b>{edu.get('degree', '')}</b>, {edu.get('institution', '')} - {edu.get('year', '')}", normal_style),
+                    *([Paragraph(f"Relevant Coursework: {edu['coursework']}", normal_style)] if edu.get('coursework') else []),
+                ]
+                for edu in template_data['education']
+            ))
             content.append(Spacer(1, 12))
         
         # Skills
         if template_data['skills']:
             content.append(Paragraph("SKILLS", heading_style))
-            for skill_cat in template_data['skills']:
-                skill_text = f"<b>{skill_cat.get('category', '')}:</b> {', '.join(skill_cat.get('items', []))}"
-                content.append(Paragraph(skill_text, normal_style))
+            content.extend(
+                Paragraph(f"<b>{skill_cat.get('category', '')}:</b> {', '.join(skill_cat.get('items', []))}", normal_style)
+                for skill_cat in template_data['skills']
+            )
             content.append(Spacer(1, 12))
         
         # Experience
         if template_data['experience']:
             content.append(Paragraph("EXPERIENCE", heading_style))
-            for exp in template_data['experience']:
-                exp_header = f"<b>{exp.get('role', '')}</b> - {exp.get('duration', '')}<br/>{exp.get('company', '')} | {exp.get('location', '')}"
-                content.append(Paragraph(exp_header, normal_style))
-                for achievement in exp.get('achievements', []):
-                    content.append(Paragraph(f"• {achievement}", normal_style))
-                content.append(Spacer(1, 6))
+            content.extend(chain.from_iterable(
+                [
+                    Paragraph(f"<b>{exp.get('role', '')}</b> - {exp.get('duration', '')}<br/>{exp.get('company', '')} | {exp.get('location', '')}", normal_style),
+                    *[Paragraph(f"• {achievement}", normal_style) for achievement in exp.get('achievements', [])],
+                    Spacer(1, 6),
+                ]
+                for exp in template_data['experience']
+            ))
         
         # Projects
         if template_data['projects']:
             content.append(Paragraph("PROJECTS", heading_style))
-            for project in template_data['projects']:
-                project_text = f"<b>{project.get('title', '')}</b>: {project.get('description', '')}"
-                content.append(Paragraph(project_text, normal_style))
+            content.extend(
+                Paragraph(f"<b>{project.get('title', '')}</b>: {project.get('description', '')}", normal_style)
+                for project in template_data['projects']
+            )
             content.append(Spacer(1, 12))
         
         # Build PDF
@@ -343,55 +539,17 @@ class ResumeGenerator:
         pdf_path = self.output_dir / f"resume_{resume_id}.pdf"
         
         # Generate PDF from HTML
-        weasyprint.HTML(string=html_content).write_pdf(str(pdf_path))
+        _weasyprint().HTML(string=html_content).write_pdf(str(pdf_path))
         
         return pdf_path
     
     def _create_html_resume(self, template_data: Dict[str, Any]) -> str:
         """Create HTML version of resume for WeasyPrint."""
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0.4in; }}
-                .header {{ text-align: center; margin-bottom: 20px; }}
-                .name {{ font-size: 18px; font-weight: bold; text-transform: uppercase; }}
-                .contact {{ margin: 5px 0; }}
-                .section {{ margin: 15px 0; }}
-                .section-title {{ font-weight: bold; font-size: 12px; text-transform: uppercase; 
-                                 border-bottom: 1px solid black; padding-bottom: 2px; margin-bottom: 8px; }}
-                .experience-item {{ margin-bottom: 10px; }}
-                .experience-header {{ font-weight: bold; }}
-                .experience-details {{ font-style: italic; }}
-                ul {{ margin: 5px 0; padding-left: 20px; }}
-                li {{ margin: 2px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <div class="name">{template_data['name']}</div>
-                <div class="contact">{template_data['phone']} | {template_data['location']}</div>
-                <div class="contact">{template_data['email']} | {template_data['linkedin_display']} | {template_data['website_display']}</div>
-            </div>
-            
-            <div class="section">
-                <div class="section-title">Objective</div>
-                <p>{template_data['objective']}</p>
-            </div>
-        """
+        if self._html_template is None:
+            raise ResumeGenerationError("HTML resume template not available")
         
-        # Add other sections...
-        # (This is a simplified version - you can expand it)
-        
-        html += """
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._html_template.render(**template_data)
     
     def get_resume_path(self, resume_id: str) -> Optional[Path]:
         """Get the file path for a generated resume."""
@@ -402,14 +560,30 @@ class ResumeGenerator:
         """Clean up resume files older than specified days."""
         import time
         
-        current_time = time.time()
-        cutoff_time = current_time - (days_old * 24 * 60 * 60)
+        cutoff_time = time.time() - (days_old * 24 * 60 * 60)
         
-        for file_path in self.output_dir.glob("resume_*.pdf"):
-            if file_path.stat().st_mtime < cutoff_time:
-                file_path.unlink()
-                logger.info(f"Cleaned up old resume: {file_path.name}")
+        # scandir entries carry their stat results, so each file costs one stat
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith("resume_") and entry.name.endswith(".pdf")
+                        and entry.is_file(follow_symlinks=False)
+                        and entry.stat().st_mtime < cutoff_time):
+                    os.unlink(entry.path)
+                    logger.info(f"Cleaned up old resume: {entry.name}")
 
 
 # Global instance
-resume_generator = ResumeGenerator()
\ No newline at end of file
+resume_generator = ResumeGenerator()
+
+
+def _generate_one(
+    request: Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]], Optional[Dict[str, Any]], Optional[str]]
+) -> Dict[str, Any]:
+    """Bulk-generation worker: generate one resume with this process's generator."""
+    user_data, selected_projects, job_context, job_id = request
+    return resume_generator.generate_resume(
+        user_data=user_data,
+        selected_projects=selected_projects,
+        job_context=job_context,
+        job_id=job_id
+    )
\ No newline at end of file
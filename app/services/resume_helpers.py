@@ -11,16 +11,22 @@ def filter_projects_by_ids(
     all_projects: List[ProjectItem], 
     selected_ids: List[str]
 ) -> List[Dict[str, Any]]:
-    """Filter projects by selected IDs."""
+    """Filter projects by selected IDs (project IDs are list indices)."""
+    dumped: Dict[int, Dict[str, Any]] = {}  # Each project is serialized at most once
+    n_projects = len(all_projects)
     selected_projects = []
     
-    for i, project_id in enumerate(selected_ids):
+    for project_id in selected_ids:
         try:
             index = int(project_id)
-            if 0 <= index < len(all_projects):
-                selected_projects.append(all_projects[index].dict())
-        except (ValueError, IndexError):
+        except ValueError:
             logger.warning(f"Invalid project ID: {project_id}")
+            continue
+        
+        if 0 <= index < n_projects:
+            if index not in dumped:
+                dumped[index] = all_projects[index].model_dump(mode="python")
+            selected_projects.append(dumped[index])
     
     return selected_projects
 
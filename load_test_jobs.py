@@ -5,8 +5,11 @@ Load test jobs into Supabase for development and testing.
 
 import asyncio
 from loguru import logger
-from app.database.base import SessionLocal
+from app.database.base import SessionLocal, AsyncSessionLocal
+from app.models.job import Job
 from app.services.job_service import JobService
+from app.services.job_source_config import job_source_manager
+from app.services.job_storage import JobStorageService
 
 
 async def load_jobs_for_testing():
@@ -30,33 +33,51 @@ async def load_jobs_for_testing():
     db = SessionLocal()
     job_service = JobService(db)
     
-    total_new_jobs = 0
-    total_fetched = 0
+    # Overlap network latency across keyword sets; the semaphore keeps upstream APIs happy
+    sem = asyncio.Semaphore(4)
     
-    try:
-        for i, keywords in enumerate(keyword_sets, 1):
+    async def fetch_batch(i, keywords):
+        async with sem:
             logger.info(f"Batch {i}/{len(keyword_sets)}: Fetching {keywords}")
-            
-            try:
-                results = await job_service.fetch_and_store_jobs(
-                    keywords=keywords,
-                    limit_per_source=20  # 20 jobs per source per keyword set
+            jobs = []
+            for fetcher in job_service.fetchers:
+                try:
+                    jobs.extend(await fetcher.fetch_jobs(keywords, limit=20))  # 20 jobs per source per keyword set
+                except Exception as e:
+                    logger.error(f"Batch {i}: {fetcher.get_source_name()} fetch failed: {e}")
+            logger.info(f"Batch {i} fetched {len(jobs)} jobs")
+            return jobs
+    
+    try:
+        batch_results = await asyncio.gather(
+            *[fetch_batch(i, keywords) for i, keywords in enumerate(keyword_sets, 1)]
+        )
+        
+        # Sources such as RemoteOK return the same feed for every keyword set, so drop
+        # repeats before storing; storage then runs from one session, one batch at a time,
+        # and its check-then-insert dedup never races another writer
+        unique_jobs = {}
+        for batch in batch_results:
+            for job in batch:
+                key = (job.source, job.external_id or (job.title.lower(), job.company.lower()))
+                unique_jobs.setdefault(key, job)
+        jobs_to_store = list(unique_jobs.values())
+        
+        total_fetched = sum(len(batch) for batch in batch_results)
+        total_new_jobs = 0
+        
+        # Loading into an empty table: the list is already de-duplicated, so bulk-load it
+        # in one initial-sync call (COPY) instead of checking each job against the table
+        initial_sync = db.query(Job.id).first() is None
+        batch_size = max(len(jobs_to_store), 1) if initial_sync else JobService.STORE_BATCH_SIZE
+        
+        async with AsyncSessionLocal() as async_db:
+            storage = JobStorageService(db, async_db)
+            for start in range(0, len(jobs_to_store), batch_size):
+                _, new_jobs, _ = await storage.store_jobs(
+                    jobs_to_store[start:start + batch_size], initial_sync=initial_sync
                 )
-                
-                batch_new = results["new_jobs"]
-                batch_total = results["total_fetched"]
-                
-                total_new_jobs += batch_new
-                total_fetched += batch_total
-                
-                logger.info(f"Batch {i} complete: {batch_new} new jobs, {batch_total} total fetched")
-                
-                # Small delay to be respectful to APIs
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Batch {i} failed: {e}")
-                continue
+                total_new_jobs += new_jobs
         
         # Final statistics
         stats = job_service.get_job_statistics()
@@ -64,7 +85,7 @@ async def load_jobs_for_testing():
         logger.info("")
         logger.info("🎉 Job loading complete!")
         logger.info(f"📊 Results:")
-        logger.info(f"  - Total fetched this session: {total_fetched}")
+        logger.info(f"  - Total fetched this session: {total_fetched} ({len(jobs_to_store)} unique)")
         logger.info(f"  - New jobs added: {total_new_jobs}")
         logger.info(f"  - Total jobs in database: {stats['total_jobs']}")
         logger.info(f"  - Jobs by source: {stats['jobs_by_source']}")
@@ -76,6 +97,7 @@ async def load_jobs_for_testing():
         
     finally:
         db.close()
+        await job_source_manager.aclose()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,23 @@
+import os
+
 import uvicorn
 from loguru import logger
 
 if __name__ == "__main__":
-    logger.info("🚀 Starting Job Application System development server...")
-    
+    # Auto-reload only in development; it adds a supervisor process and a file watcher
+    reload = os.getenv("APP_ENV", "dev") == "dev"
+
+    logger.info(f"🚀 Starting Job Application System {'development' if reload else 'production'} server...")
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        # "auto" uses uvloop/httptools from uvicorn[standard] where installed (not on Windows)
+        loop="auto",
+        http="auto",
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
         log_config=None,  # Use loguru instead of uvicorn's logging
         access_log=False  # Disable uvicorn access logs, use our structured logging
-    )
\ No newline at end of file
+    )
@@ -4,14 +4,15 @@ Setup script for development environment.
 """
 
 import subprocess
+import shutil
 import sys
 import os
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_command(argv: list, description: str):
+    """Run a command (argv list, no shell) and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -24,7 +25,7 @@ def main():
     print("🚀 Setting up Job Application System development environment...")
     
     # Install dependencies
-    if not run_command("pip install -r requirements.txt", "Installing Python dependencies"):
+    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], "Installing Python dependencies"):
         print("❌ Failed to install dependencies. Please check your Python environment.")
         return False
     
@@ -37,7 +38,8 @@ def main():
     # Copy environment file if it doesn't exist
     if not os.path.exists(".env"):
         if os.path.exists(".env.example"):
-            run_command("copy .env.example .env", "Creating .env file from example")
+            shutil.copyfile(".env.example", ".env")
+            print("✅ Created .env file from example")
         else:
             print("⚠️  Please create a .env file based on .env.example")
     
@@ -1,76 +1,149 @@
 #!/usr/bin/env python3
 """
 Database setup script for development.
+
+Run it as ``python -s setup_db.py`` to skip the user site-packages scan at
+interpreter start-up; ``-S`` is not an option because the dependencies live
+in site-packages.
 """
 
+import asyncio
 import sys
-from loguru import logger
+from pathlib import Path
+
+__all__ = ["main", "cli"]
+
+SCHEMA_HASH_FILE = Path(__file__).resolve().parent / ".applybot_schema.hash"
+
+
+def _info(message):
+    print(message, file=sys.stderr)
+
+
+def _error(message):
+    print(message, file=sys.stderr)
+
+
+def _schema_fingerprint(metadata, database_url):
+    """Hash the target database and every table's columns and indexes, in a stable order."""
+    import hashlib
+    
+    digest = hashlib.sha256(database_url.encode())
+    for name in sorted(metadata.tables):
+        table = metadata.tables[name]
+        digest.update(name.encode())
+        for column in table.columns:
+            digest.update(f"{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}".encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(f"{index.name}:{[c.name for c in index.columns]}:{index.unique}".encode())
+    return digest.hexdigest()
+
+
+async def _probe_database(dsn):
+    """Connect with asyncpg and return the current database name, or None on failure."""
+    import asyncpg
+    
+    try:
+        conn = await asyncpg.connect(dsn=dsn, statement_cache_size=0, timeout=30)
+    except Exception as e:
+        _error(f"Database connection failed: {e}")
+        return None
+    try:
+        return await conn.fetchval("SELECT current_database()")
+    finally:
+        await conn.close()
+
+
+def _import_init_db():
+    import app.database.init_db as init_db_module
+    return init_db_module
+
 
 def main():
     """Set up the Supabase database for development."""
-    logger.info("🗄️Setting up Supabase database for Job Application System...")
+    return asyncio.run(_setup())
+
+
+async def _setup():
+    _info("🗄️Setting up Supabase database for Job Application System...")
     
     try:
         from app.core.config import settings
-        from app.database.init_db import create_database_if_not_exists, init_db, check_db_connection
         
         # Verify Supabase configuration
         if not settings.DATABASE_URL:
-            logger.error("❌ DATABASE_URL not configured!")
-            logger.info("Please set up your Supabase credentials:")
-            logger.info("  1. Manually edit .env file with your Supabase details")
-            logger.info("  2. See SUPABASE_SETUP.md for detailed instructions")
+            _error("❌ DATABASE_URL not configured!")
+            _info("Please set up your Supabase credentials:")
+            _info("  1. Manually edit .env file with your Supabase details")
+            _info("  2. See SUPABASE_SETUP.md for detailed instructions")
             return False
         
-        logger.info("✅ Supabase configuration detected")
+        _info("✅ Supabase configuration detected")
         
-        # Step 1: Database already exists in Supabase
-        logger.info("Step 1: Verifying Supabase database...")
-        create_database_if_not_exists()
+        # Steps 1-2: probe the database while SQLAlchemy, the engine and the models
+        # load in a thread, so the connection round-trips overlap the import
+        _info("Step 1: Verifying Supabase database...")
+        _info("Step 2: Testing Supabase connection...")
+        database_name, init_db_module = await asyncio.gather(
+            _probe_database(settings.getAsyncpgDsn),
+            asyncio.to_thread(_import_init_db),
+        )
+        init_db_module.createDatabaseIfNotExists()
         
-        # Step 2: Check connection
-        logger.info("Step 2: Testing Supabase connection...")
-        if not check_db_connection():
-            logger.error("❌ Supabase connection failed!")
-            logger.info("Troubleshooting:")
-            logger.info("  1. Check your DATABASE_URL in .env")
-            logger.info("  2. Verify Supabase project is active (not paused)")
-            logger.info("  3. Ensure database password is correct")
-            logger.info("  4. Check if project reference is correct")
-            logger.info("  5. Check SUPABASE_SETUP.md for setup instructions")
+        if database_name is None:
+            _error("❌ Supabase connection failed!")
+            _info("Troubleshooting:")
+            _info("  1. Check your DATABASE_URL in .env")
+            _info("  2. Verify Supabase project is active (not paused)")
+            _info("  3. Ensure database password is correct")
+            _info("  4. Check if project reference is correct")
+            _info("  5. Check SUPABASE_SETUP.md for setup instructions")
             return False
+        _info(f"✅ Connected to database '{database_name}'")
+        
+        # Step 3: Initialize tables, unless this schema was already applied to this database
+        from app.database.base import Base
+        
+        fingerprint = _schema_fingerprint(Base.metadata, settings.DATABASE_URL)
+        if SCHEMA_HASH_FILE.exists() and SCHEMA_HASH_FILE.read_text().strip() == fingerprint:
+            _info("✅ Schema unchanged since last setup - skipping table creation")
+            return True
         
-        # Step 3: Initialize tables
-        logger.info("Step 3: Creating database tables in Supabase...")
-        if init_db():
-            logger.info("✅ Supabase database setup completed successfully!")
-            logger.info("")
-            logger.info("📋 Database tables created:")
-            logger.info("  - users (for user profiles)")
-            logger.info("  - projects (for user projects)")
-            logger.info("  - jobs (for job listings)")
-            logger.info("  - applications (for tracking applications)")
-            logger.info("")
-            logger.info("🎉 Supabase is ready!")
-            logger.info("  - View tables: Supabase Dashboard > Table Editor")
-            logger.info("  - Run queries: Supabase Dashboard > SQL Editor")
-            logger.info("  - Monitor usage: Supabase Dashboard > Settings > Usage")
-            logger.info("")
-            logger.info("🚀 You can now start the API server with: python start_server.py")
+        _info("Step 3: Creating database tables in Supabase...")
+        if init_db_module.init_db():
+            SCHEMA_HASH_FILE.write_text(fingerprint)
+            _info("✅ Supabase database setup completed successfully!")
+            _info("")
+            _info("📋 Database tables created:")
+            _info("  - users (for user profiles)")
+            _info("  - projects (for user projects)")
+            _info("  - jobs (for job listings)")
+            _info("  - applications (for tracking applications)")
+            _info("")
+            _info("🎉 Supabase is ready!")
+            _info("  - View tables: Supabase Dashboard > Table Editor")
+            _info("  - Run queries: Supabase Dashboard > SQL Editor")
+            _info("  - Monitor usage: Supabase Dashboard > Settings > Usage")
+            _info("")
+            _info("🚀 You can now start the API server with: python start_server.py")
             return True
         else:
-            logger.error("❌ Database initialization failed!")
+            _error("❌ Database initialization failed!")
             return False
             
     except ImportError as e:
-        logger.error(f"❌ Import error: {e}")
-        logger.info("Please install dependencies: pip install -r requirements.txt")
+        _error(f"❌ Import error: {e}")
+        _info("Please install dependencies: pip install -r requirements.txt")
         return False
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
+        _error(f"❌ Unexpected error: {e}")
         return False
 
 
+def cli():
+    """Console entry point: exit with the setup result as the status code."""
+    sys.exit(0 if main() else 1)
+
+
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    cli()
@@ -3,33 +3,67 @@
 Start the FastAPI development server for testing.
 """
 
-import uvicorn
-from loguru import logger
-from app.main import app
+_BANNER = "\n".join((
+    "🚀 Starting Job Application System API server...",
+    "📋 Available endpoints:",
+    "  - API Documentation: http://localhost:8000/docs",
+    "  - Alternative Docs: http://localhost:8000/redoc",
+    "  - Health Check: http://localhost:8000/health",
+    "  - Root: http://localhost:8000/",
+    "",
+    "📮 Import postman_collection.json into Postman to test all endpoints",
+    "🛑 Press Ctrl+C to stop the server",
+    "",
+)).encode()
 
 def main():
-    """Start the development server."""
-    logger.info("🚀 Starting Job Application System API server...")
-    logger.info("📋 Available endpoints:")
-    logger.info("  - API Documentation: http://localhost:8000/docs")
-    logger.info("  - Alternative Docs: http://localhost:8000/redoc")
-    logger.info("  - Health Check: http://localhost:8000/health")
-    logger.info("  - Root: http://localhost:8000/")
-    logger.info("")
-    logger.info("📮 Import postman_collection.json into Postman to test all endpoints")
-    logger.info("🛑 Press Ctrl+C to stop the server")
+    """Start the API server; set APPLYBOT_RELOAD=1 for auto-reload during development."""
+    # Imported here so importing this module stays cheap: with reload on, uvicorn's
+    # supervisor only holds the "app.main:app" string, and the spawned worker
+    # re-imports this file as __mp_main__ before importing the app once
+    import importlib.util
+    import os
+    import sys
+    import uvicorn
+
+    os.write(2, _BANNER)  # pre-encoded; one syscall, well under PIPE_BUF
+    
+    # Read by app.main when it builds the app (in workers too, via the inherited environment)
+    os.environ.setdefault("APPLYBOT_JSON", "orjson")
+    
+    reload = os.environ.get("APPLYBOT_RELOAD", "0") == "1"
+    workers = 1 if reload else int(os.environ.get("WEB_CONCURRENCY", "1"))
+    
+    if workers > 1 and importlib.util.find_spec("gunicorn"):
+        # uvicorn spawns each worker and re-imports the app there; gunicorn --preload
+        # imports it once and forks, so workers share the parent's pages copy-on-write
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn", "app.main:app",
+            "--preload",
+            "--worker-class", "uvicorn.workers.UvicornWorker",
+            "--workers", str(workers),
+            "--bind", "0.0.0.0:8000",
+        ])
     
     try:
         uvicorn.run(
-            app,
+            "app.main:app",  # Import string: the reloader imports the app in its worker only
             host="0.0.0.0",
             port=8000,
-            reload=True,
+            reload=reload,
+            # Watch only the app package; watchfiles (uvicorn[standard]) handles the events
+            reload_dirs=["app"] if reload else None,
+            reload_includes=["*.py"] if reload else None,
+            reload_excludes=["*.pyc", "__pycache__", ".venv/*", "tests/*", "*.log"] if reload else None,
+            # "auto" uses uvloop/httptools from uvicorn[standard] where installed (not on Windows)
+            loop="auto",
+            http="auto",
+            workers=None if reload else workers,
             log_config=None,  # Use loguru instead
             access_log=False  # Disable uvicorn access logs
         )
     except KeyboardInterrupt:
-        logger.info("🛑 Server stopped by user")
+        print("🛑 Server stopped by user", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from cachetools import TLRUCache
+
+from app.services.matching.cache_service import MatchingCacheService, _entry_expiry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _result(title):
+    return SimpleNamespace(
+        project=SimpleNamespace(id=title, title=title),
+        confidence_score=0.5,
+        explanation={},
+        matching_keywords=[],
+        similarity_breakdown={},
+    )
+
+
+def _service(maxsize=100):
+    clock = FakeClock()
+    service = MatchingCacheService(redis_url=None, default_ttl=3600)
+    service.memory_cache = TLRUCache(maxsize=maxsize, ttu=_entry_expiry, timer=clock)
+    return service, clock
+
+
+def test_memory_cache_honours_per_call_ttl():
+    service, clock = _service()
+    service.cache_results("match:u1:short", [_result("a")], ttl=10)
+    service.cache_results("match:u1:default", [_result("b")])
+
+    clock.now = 11
+
+    assert service.get_cached_results("match:u1:short") is None
+    assert service.get_cached_results("match:u1:default")[0]["project_title"] == "b"
+
+
+def test_user_index_does_not_outgrow_the_cache():
+    service, clock = _service(maxsize=4)
+
+    for i in range(200):
+        service.cache_results(f"match:user{i}:job", [_result("a")])
+
+    indexed = sum(len(keys) for keys in service._user_index.values())
+    assert indexed <= 2 * service.memory_cache.maxsize
+    assert service.invalidate_user_cache("user199") == 1
+
+
+def test_compression_reuses_per_thread_contexts_and_reads_plain_payloads():
+    service, _ = _service()
+    payload = b'{"project": "API service"}' * 50
+
+    assert service._decompress(service._compress(payload)) == payload
+    assert service._decompress(payload) == payload  # Uncompressed entries pass through
+
+    compressor = getattr(service._zstd, "compressor", None)
+    service._compress(payload)
+    assert getattr(service._zstd, "compressor", None) is compressor
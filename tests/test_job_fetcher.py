@@ -0,0 +1,65 @@
+import asyncio
+
+import httpx
+
+from app.services import job_fetcher
+from app.services.job_fetcher import RemoteOKFetcher
+
+
+REMOTEOK_FEED = [
+    {"legal": "metadata"},
+    {
+        "id": "1001",
+        "position": "Backend Python Engineer",
+        "company": "Acme",
+        "description": "Build APIs with Python and FastAPI",
+        "tags": ["python", "fastapi"],
+        "location": "Remote",
+    },
+]
+
+
+def test_fetch_without_injected_client_opens_its_own(monkeypatch):
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=REMOTEOK_FEED))
+    monkeypatch.setattr(job_fetcher.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs))
+
+    fetcher = RemoteOKFetcher(client=None)
+    jobs = asyncio.run(fetcher.fetch_jobs(["python"], limit=10))
+
+    assert [job.title for job in jobs] == ["Backend Python Engineer"]
+
+
+def test_reed_iter_jobs_yields_each_page_before_requesting_the_next():
+    from app.services.job_fetcher import ReedFetcher
+
+    requests = []
+
+    def handler(request):
+        skip = int(request.url.params.get("resultsToSkip", 0))
+        take = int(request.url.params["resultsToTake"])
+        requests.append((skip, take))
+        available = max(0, min(take, 130 - skip))  # 130 results in total
+        return httpx.Response(200, json={"results": [
+            {"jobId": skip + i, "jobTitle": f"Engineer {skip + i}", "employerName": "Acme", "jobDescription": "Python"}
+            for i in range(available)
+        ]})
+
+    async def collect():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        fetcher = ReedFetcher(client=client)
+        fetcher.api_key = "test-key"
+        pages_requested_at_first_job = None
+        jobs = []
+        async for job in fetcher.iter_jobs(["python"], limit=150):
+            if pages_requested_at_first_job is None:
+                pages_requested_at_first_job = len(requests)
+            jobs.append(job)
+        await client.aclose()
+        return pages_requested_at_first_job, jobs
+
+    pages_requested_at_first_job, jobs = asyncio.run(collect())
+
+    assert pages_requested_at_first_job == 1
+    assert requests == [(0, 100), (100, 50)]
+    assert [job.external_id for job in jobs] == [str(i) for i in range(130)]
@@ -0,0 +1,87 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import resume
+from app.database.base import get_db
+
+
+JOBS = {
+    "job-1": SimpleNamespace(
+        title="Backend Python Engineer",
+        company="Acme",
+        description="Build APIs with Python and FastAPI",
+        requirements=["python", "fastapi"],
+        location="Remote",
+    ),
+}
+
+PROJECTS = [
+    SimpleNamespace(
+        title="API service",
+        description="FastAPI backend with PostgreSQL",
+        technologies=["FastAPI", "PostgreSQL"],
+        skills_demonstrated=["Python"],
+        project_url=None,
+    ),
+]
+
+
+class FakeProjectService:
+    def __init__(self, db):
+        pass
+
+    def get_user_projects(self, user_id, limit=50):
+        return PROJECTS
+
+
+class FakeJobService:
+    def __init__(self, db):
+        pass
+
+    def get_job_by_id(self, job_id):
+        return JOBS.get(job_id)
+
+
+def test_bulk_generate_compiles_prepared_jobs_and_reports_missing_ones(monkeypatch):
+    monkeypatch.setattr(resume, "ProjectService", FakeProjectService)
+    monkeypatch.setattr(resume, "JobService", FakeJobService)
+
+    generated = []
+
+    def generate_resumes_bulk(requests):
+        generated.extend(requests)
+        return [
+            {"resume_id": job_id, "file_path": f"/tmp/{job_id}.pdf", "generation_method": "reportlab"}
+            for _, _, _, job_id in requests
+        ]
+
+    monkeypatch.setattr(resume.resume_generator, "generate_resumes_bulk", generate_resumes_bulk)
+
+    app = FastAPI()
+    app.include_router(resume.router, prefix="/api/v1/resume")
+    app.dependency_overrides[get_db] = lambda: None
+
+    async def post():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(
+                "/api/v1/resume/bulk-generate",
+                params={"user_id": "user-1"},
+                json={
+                    "job_ids": ["job-1", "missing"],
+                    "name": "Test User",
+                    "phone": "+1-555-0100",
+                    "location": "Remote",
+                    "email": "test@example.com",
+                },
+            )
+
+    response = asyncio.run(post())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["job_id"] for r in body["resumes_generated"]] == ["job-1"]
+    assert [f["job_id"] for f in body["failed_jobs"]] == ["missing"]
+    assert [job_id for *_, job_id in generated] == ["job-1"]
@@ -0,0 +1,89 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services.matching.base_matcher import JobContext
+import numpy as np
+import pytest
+
+from app.services.matching.cache_service import MatchingCacheService, _pack_arrays, _unpack_arrays
+from app.services.matching.TFIDF_matcher import TFIDFProjectMatcher
+
+
+USER_ID = uuid.uuid4()
+
+
+def _project(title, description, technologies, skills):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=USER_ID,
+        title=title,
+        description=description,
+        category="web",
+        technologies=technologies,
+        skills_demonstrated=skills,
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+PROJECTS = [
+    _project("Chat app", "Realtime chat built with React and Node, websockets", ["React", "Node"], ["JavaScript"]),
+    _project("ML pipeline", "Machine learning pipeline with PyTorch and pandas", ["PyTorch", "pandas"], ["Python"]),
+    _project("API service", "FastAPI backend with PostgreSQL and Docker deployment", ["FastAPI", "PostgreSQL", "Docker"], ["Python"]),
+]
+
+BACKEND_JOB = JobContext(
+    job_id="1",
+    title="Backend Python Engineer",
+    description="Build APIs with FastAPI, PostgreSQL, Docker. Python experience required.",
+    company="Acme",
+    required_skills=["Python", "FastAPI", "Docker"],
+    preferred_skills=["Kubernetes", "PostgreSQL"],
+)
+
+
+def _scores(results):
+    return [(r.project.title, r.confidence_score) for r in results]
+
+
+def test_cached_model_is_compact_and_reproduces_scores():
+    cache = MatchingCacheService(redis_url=None)
+    fitted = TFIDFProjectMatcher(cache_service=cache)
+    expected = _scores(fitted.match_projects(PROJECTS, BACKEND_JOB, max_results=3))
+
+    ((key, (ttl, state)),) = cache.memory_cache.items()
+    payload = _pack_arrays(state)
+    assert len(payload) < 64 * 1024
+
+    # A fresh matcher loads the state, as it would arrive from Redis, instead of fitting
+    cache.memory_cache[key] = (ttl, _unpack_arrays(payload))
+    loaded = TFIDFProjectMatcher(cache_service=cache)
+    assert _scores(loaded.match_projects(PROJECTS, BACKEND_JOB, max_results=3)) == expected
+    assert expected[0][0] == "API service"
+
+
+def test_cached_model_payload_refuses_pickled_objects():
+    payload = _pack_arrays({"evil": np.array([object()], dtype=object)})
+    with pytest.raises(ValueError):
+        _unpack_arrays(payload)
+
+
+def test_concurrent_matches_for_different_project_sets_do_not_mix_state():
+    from concurrent.futures import ThreadPoolExecutor
+
+    other_projects = [
+        _project("Portfolio", "Static portfolio website with HTML and CSS", ["HTML", "CSS"], []),
+        _project("Infra", "Kubernetes cluster automation with Terraform", ["Kubernetes", "Terraform"], ["DevOps"]),
+    ]
+    matcher = TFIDFProjectMatcher(cache_service=None)
+    expected = {
+        id(PROJECTS): _scores(TFIDFProjectMatcher().match_projects(PROJECTS, BACKEND_JOB, max_results=3)),
+        id(other_projects): _scores(TFIDFProjectMatcher().match_projects(other_projects, BACKEND_JOB, max_results=3)),
+    }
+
+    # Alternate project sets so every call refits the shared matcher while others are scoring
+    project_sets = [PROJECTS, other_projects] * 50
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda ps: _scores(matcher.match_projects(ps, BACKEND_JOB, max_results=3)), project_sets))
+
+    assert results == [expected[id(ps)] for ps in project_sets]